@@ -4,9 +4,32 @@ All LLM providers must implement this interface.
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from typing import Any
+import atexit
+import sys
+import threading
 import time
 
+# Logging and evaluation run off the caller's thread, on one pool shared by all providers
+_LOG_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="llm-log")
+
+
+@atexit.register
+def _shutdown_background_work():
+    """
+    Exit fallback for callers that didn't call flush(), in dependency order.
+
+    Pending log jobs may queue evaluations, so the executor is drained before
+    the evaluation queue is closed. Evaluations scored here can still fail:
+    the interpreter's thread pools are already shut down (hence flush()).
+    """
+    _LOG_EXECUTOR.shutdown(wait=True)
+
+    evaluator = sys.modules.get(f"{__package__}.evaluator")
+    if evaluator is not None:
+        evaluator.close_evaluation_queue()
+
 
 class LLMProvider(ABC):
     """Abstract base for all LLM providers."""
@@ -28,11 +51,28 @@ class LLMProvider(ABC):
         self.enable_evaluation = config.get("enable_evaluation", False)
         self.eval_context = config.get("eval_context")
         self.eval_ground_truth = config.get("eval_ground_truth")
-        self.logger = None
+        self.eval_batch_size = config.get("eval_batch_size", 8)
+        self.eval_flush_interval = config.get("eval_flush_interval", 5.0)
+        self.eval_fast_mode = config.get("eval_fast_mode", False)
+        self.async_logging = config.get("async_logging", False)
+        self._logger = None  # ExecutionLogger, created on first access (see logger)
+        self.last_cache_hit = False  # Set by providers that serve responses from a cache
+        self.last_first_token_ms = None  # Set by providers that stream responses
+        self._cost_rates = None  # Per-token prices, resolved on first log
+        self._pending_logs: set[Future] = set()  # Logging jobs not finished yet (see flush)
+        self._pending_lock = threading.Lock()
 
-        if self.enable_logging:
-            from .logger import ExecutionLogger
-            self.logger = ExecutionLogger()
+    @property
+    def logger(self):
+        """ExecutionLogger for this provider, created on first access (None if logging is disabled)."""
+        if self._logger is None and self.enable_logging:
+            if self.async_logging:
+                from .logger import AsyncExecutionLogger
+                self._logger = AsyncExecutionLogger()
+            else:
+                from .logger import ExecutionLogger
+                self._logger = ExecutionLogger()
+        return self._logger
 
     @abstractmethod
     def generate(
@@ -93,6 +133,10 @@ class LLMProvider(ABC):
         """
         Generate response with automatic logging.
 
+        The response is returned as soon as generation finishes; logging and
+        evaluation are performed by a background worker. Call flush() before
+        the program exits, or evaluations may be lost.
+
         This method wraps the generate() method to add automatic logging of:
         - Prompt and response
         - Token usage and costs
@@ -108,63 +152,153 @@ class LLMProvider(ABC):
         Returns:
             Generated text response
         """
-        # Measure latency
-        start_time = time.perf_counter()
+        # Measure latency (integer nanoseconds; converted to ms by the logging worker)
+        self.last_first_token_ms = None
+        start_ns = time.monotonic_ns()
 
         # Generate response
         response = self.generate(prompt, system_prompt, temperature, max_tokens)
 
-        # Calculate latency in milliseconds
-        end_time = time.perf_counter()
-        latency_ms = (end_time - start_time) * 1000
+        latency_ns = time.monotonic_ns() - start_ns
 
-        # Log execution if enabled
+        # Hand logging/evaluation off to the background worker
         if self.enable_logging and self.logger:
             try:
-                from .pricing import CostCalculator
-
-                # Get token usage from provider
+                # Snapshot per-call state now: the next generate() overwrites it
                 usage = self.get_usage_info()
-
-                # Get metadata
-                metadata = self.get_metadata()
-
-                # Calculate cost
-                cost_calc = CostCalculator()
-                cost = cost_calc.calculate_cost(
-                    self.model_name,
-                    usage["input_tokens"],
-                    usage["output_tokens"]
+                future = _LOG_EXECUTOR.submit(
+                    self._log_execution,
+                    prompt,
+                    system_prompt,
+                    response,
+                    usage,
+                    self.get_metadata(),
+                    latency_ns,
+                    self.last_first_token_ms,
+                    self.last_cache_hit,
+                    self.enable_evaluation,
+                    self.eval_context,
+                    self.eval_ground_truth,
+                    self.eval_fast_mode,
                 )
-
-                # Log execution
-                log_file = self.logger.log_execution(
-                    prompt={"user": prompt, "system": system_prompt},
-                    response=response,
-                    metadata=metadata,
-                    tokens=usage,
-                    cost=cost,
-                    latency=latency_ms
-                )
-
-                # Add evaluation if enabled
-                if self.enable_evaluation and log_file:
-                    try:
-                        from .evaluator import evaluate_response
-                        eval_results = evaluate_response(
-                            prompt,
-                            response,
-                            context=self.eval_context,
-                            ground_truth=self.eval_ground_truth
-                        )
-                        self.logger.add_evaluation_metrics(log_file, eval_results)
-                    except Exception as e:
-                        from loguru import logger as log
-                        log.warning(f"⚠️ Evaluation failed: {e}")
-
+                with self._pending_lock:
+                    self._pending_logs.add(future)
+                future.add_done_callback(self._log_done)
             except Exception as e:
                 from loguru import logger as log
                 log.warning(f"⚠️ Logging failed: {e}")
 
         return response
 
+    def _log_done(self, future: Future):
+        """Forget a finished logging job."""
+        with self._pending_lock:
+            self._pending_logs.discard(future)
+
+    def flush(self):
+        """
+        Block until logging and evaluation of previous calls are complete.
+
+        Call this before the program exits: work left for atexit runs after the
+        interpreter has shut down its thread pools, which RAGAS relies on.
+        """
+        with self._pending_lock:
+            pending = list(self._pending_logs)
+        wait(pending)
+
+        # Evaluations queued by those jobs, then any log writes still batched
+        from .evaluator import flush_evaluations
+        flush_evaluations()
+
+        flush_logs = getattr(self._logger, "flush", None)
+        if flush_logs is not None:
+            flush_logs()
+
+    def _log_execution(
+        self,
+        prompt: str,
+        system_prompt: str | None,
+        response: str,
+        usage: dict[str, int],
+        metadata: dict[str, Any],
+        latency_ns: int,
+        first_token_ms: float | None,
+        cache_hit: bool,
+        enable_evaluation: bool,
+        eval_context: str | None,
+        eval_ground_truth: str | None,
+        eval_fast_mode: bool,
+    ):
+        """
+        Log one execution and optionally evaluate it (runs on the logging worker).
+
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            response: Generated text response
+            usage: Token usage captured right after generation
+            metadata: Provider metadata
+            latency_ns: Generation latency in nanoseconds
+            first_token_ms: Time to first streamed chunk in milliseconds (None if not streamed)
+            cache_hit: Whether the response was served from a cache
+            enable_evaluation: Whether to run evaluation
+            eval_context: Optional context for evaluation
+            eval_ground_truth: Optional ground truth for evaluation
+            eval_fast_mode: Whether to use embedding-only fast evaluation
+        """
+        try:
+            from .pricing import cost_from_rates, get_rates
+
+            # Resolve per-token prices once (model_name is final after subclass __init__)
+            if self._cost_rates is None:
+                self._cost_rates = get_rates(self.model_name)
+
+            # A cache hit made no API call: it costs nothing, the original
+            # generation's usage is kept apart for reference
+            cached_usage = None
+            if cache_hit:
+                cached_usage = usage
+                usage = {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0}
+
+            # Calculate cost
+            cost = cost_from_rates(
+                self._cost_rates,
+                usage["input_tokens"],
+                usage["output_tokens"],
+                cache_creation_tokens=usage.get("cache_creation_input_tokens", 0),
+                cache_read_tokens=usage.get("cache_read_input_tokens", 0)
+            )
+
+            # Log execution
+            log_file = self.logger.log_execution(
+                prompt={"user": prompt, "system": system_prompt},
+                response=response,
+                metadata=metadata,
+                tokens=usage,
+                cost=cost,
+                latency=latency_ns / 1e6,
+                first_token_ms=first_token_ms,
+                cache_hit=cache_hit,
+                cached_usage=cached_usage
+            )
+
+            # Queue evaluation if enabled (scored in batches, written back to log_file)
+            if enable_evaluation and log_file:
+                try:
+                    from .evaluator import get_evaluation_queue
+                    get_evaluation_queue(self.eval_batch_size, self.eval_flush_interval).submit(
+                        log_file,
+                        self.logger,
+                        prompt,
+                        response,
+                        context=eval_context,
+                        ground_truth=eval_ground_truth,
+                        fast_mode=eval_fast_mode
+                    )
+                except Exception as e:
+                    from loguru import logger as log
+                    log.warning(f"⚠️ Evaluation failed: {e}")
+
+        except Exception as e:
+            from loguru import logger as log
+            log.warning(f"⚠️ Logging failed: {e}")
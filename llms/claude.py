@@ -3,8 +3,13 @@ Claude (Anthropic) LLM provider.
 Supports Claude Opus, Sonnet, and Haiku models.
 """
 
+import asyncio
+import time
+import weakref
+from collections.abc import Iterator
+from types import SimpleNamespace
 from typing import Any
-from anthropic import Anthropic
+from anthropic import Anthropic, AsyncAnthropic
 from loguru import logger
 
 from .base import LLMProvider
@@ -23,6 +28,15 @@ class ClaudeProvider(LLMProvider):
                 - temperature: Sampling temperature (default: 0.1)
                 - max_tokens: Maximum tokens (default: 4096)
                 - api_key: Anthropic API key (required)
+                - semantic_cache: Serve semantically equivalent prompts from cache (default: False)
+                - semantic_cache_threshold: Minimum cosine similarity for a hit (default: 0.95)
+                - semantic_cache_dir: Directory for the persisted cache (default: ".cache")
+                - prompt_caching: Mark static prompt prefixes with cache_control (default: False).
+                  Cache writes cost 1.25x the input price, so enable it only when the same
+                  prefix is reused within minutes (e.g. generate_many, eval sweeps)
+                - cache_breakpoint: Marker splitting a prompt into a cached static prefix
+                  and a dynamic suffix (default: None, whole system prompt is cached).
+                  The marker itself is removed from the text sent to the model
         """
         super().__init__(config)
         
@@ -34,6 +48,28 @@ class ClaudeProvider(LLMProvider):
         self.model_name = config.get("model_name", "claude-sonnet-4-20250514")
         self.last_message = None  # Store last message for token extraction
 
+        # Async client for agenerate/agenerate_many (rebuilt if the event loop changes)
+        self._api_key = api_key
+        self.aclient = AsyncAnthropic(api_key=api_key)
+        self._aclient_loop = None
+
+        # Per-task messages so get_usage_info() is correct under concurrency
+        self._task_messages: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self.last_batch_usage: list[dict[str, int]] = []
+
+        # Anthropic prompt caching (static prefix is billed at the cache rate)
+        self.prompt_caching = config.get("prompt_caching", False)
+        self.cache_breakpoint = config.get("cache_breakpoint")
+        self._default_system = ""
+
+        self.semantic_cache = None
+        if config.get("semantic_cache", False):
+            from .semantic_cache import SemanticCache
+            self.semantic_cache = SemanticCache(
+                cache_dir=config.get("semantic_cache_dir", ".cache"),
+                threshold=config.get("semantic_cache_threshold", 0.95),
+            )
+
         logger.success(f"✅ Claude LLM initialized: {self.model_name}")
 
     def generate(
@@ -43,26 +79,267 @@ class ClaudeProvider(LLMProvider):
         temperature: float | None = None,
         max_tokens: int | None = None,
     ) -> str:
-        """Generate response using Claude."""
+        """Generate response using Claude (consumes generate_stream)."""
+        return "".join(self.generate_stream(prompt, system_prompt, temperature, max_tokens))
+
+    def generate_stream(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> Iterator[str]:
+        """
+        Stream response text from Claude as it arrives.
+
+        Time to first chunk is stored in `last_first_token_ms`; token usage is
+        available through get_usage_info() once the stream is exhausted.
+
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            temperature: Override temperature (uses default if None)
+            max_tokens: Override max tokens (uses default if None)
+
+        Yields:
+            Text chunks of the response
+        """
+        # Explicit None checks: temperature=0 is a valid override
+        temperature = temperature if temperature is not None else self.temperature
+        max_tokens = max_tokens if max_tokens is not None else self.max_tokens
+        start_time = time.perf_counter()
+        self.last_first_token_ms = None
+
         try:
-            message = self.client.messages.create(
-                model=self.model_name,
-                max_tokens=max_tokens or self.max_tokens,
-                temperature=temperature or self.temperature,
-                system=system_prompt or "",
-                messages=[{"role": "user", "content": prompt}],
-            )
+            cached = self._lookup_cache(prompt, system_prompt, temperature, max_tokens)
+            if cached is not None:
+                self.last_first_token_ms = (time.perf_counter() - start_time) * 1000
+                yield cached
+                return
+
+            with self.client.messages.stream(
+                **self._request_params(prompt, system_prompt, temperature, max_tokens)
+            ) as stream:
+                for text in stream.text_stream:
+                    if self.last_first_token_ms is None:
+                        self.last_first_token_ms = (time.perf_counter() - start_time) * 1000
+                    yield text
+
+                # Final message carries the usage object
+                message = stream.get_final_message()
 
-            # Store message for token extraction
-            self.last_message = message
+            self._handle_message(message, prompt, system_prompt, temperature, max_tokens)
 
-            response = message.content[0].text
-            return response
+        except Exception as e:
+            logger.error(f"❌ Claude generation failed: {e}")
+            raise
+
+    async def agenerate(
+        self,
+        prompt: str,
+        system_prompt: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+    ) -> str:
+        """Generate response using Claude's async client (same semantics as generate)."""
+        # Explicit None checks: temperature=0 is a valid override
+        temperature = temperature if temperature is not None else self.temperature
+        max_tokens = max_tokens if max_tokens is not None else self.max_tokens
+
+        try:
+            cached = self._lookup_cache(prompt, system_prompt, temperature, max_tokens)
+            if cached is not None:
+                return cached
+
+            message = await self._get_aclient().messages.create(
+                **self._request_params(prompt, system_prompt, temperature, max_tokens)
+            )
+            return self._handle_message(message, prompt, system_prompt, temperature, max_tokens)
 
         except Exception as e:
             logger.error(f"❌ Claude generation failed: {e}")
             raise
 
+    async def agenerate_many(
+        self,
+        prompts: list[str],
+        system_prompt: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        *,
+        max_concurrency: int = 10,
+    ) -> list[str]:
+        """
+        Generate responses for several prompts concurrently.
+
+        Args:
+            prompts: User prompts
+            system_prompt: Optional system prompt shared by all prompts
+            temperature: Override temperature (uses default if None)
+            max_tokens: Override max tokens (uses default if None)
+            max_concurrency: Maximum in-flight requests (default: 10)
+
+        Returns:
+            Responses in the same order as prompts. Token usage per prompt is
+            available afterwards in `last_batch_usage`.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _guarded(prompt: str) -> tuple[str, dict[str, int]]:
+            async with semaphore:
+                response = await self.agenerate(prompt, system_prompt, temperature, max_tokens)
+                return response, self.get_usage_info()
+
+        results = await asyncio.gather(*(_guarded(p) for p in prompts))
+        self.last_batch_usage = [usage for _, usage in results]
+        return [response for response, _ in results]
+
+    def generate_many(
+        self,
+        prompts: list[str],
+        system_prompt: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        *,
+        max_concurrency: int = 10,
+    ) -> list[str]:
+        """Synchronous wrapper around agenerate_many (for callers without an event loop)."""
+        return asyncio.run(
+            self.agenerate_many(
+                prompts, system_prompt, temperature, max_tokens, max_concurrency=max_concurrency
+            )
+        )
+
+    def _get_aclient(self) -> AsyncAnthropic:
+        """Return the async client, rebuilding it when called from a new event loop."""
+        loop = asyncio.get_running_loop()
+        if self._aclient_loop not in (None, loop):
+            # Pooled connections belong to the previous (closed) loop
+            self.aclient = AsyncAnthropic(api_key=self._api_key)
+        self._aclient_loop = loop
+        return self.aclient
+
+    def _request_params(
+        self,
+        prompt: str,
+        system_prompt: str | None,
+        temperature: float,
+        max_tokens: int,
+    ) -> dict[str, Any]:
+        """Build messages.create() keyword arguments."""
+        return {
+            "model": self.model_name,
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+            "system": self._build_system(system_prompt),
+            "messages": [{"role": "user", "content": self._build_user_content(prompt)}],
+        }
+
+    def flush(self):
+        """Finish background logging/evaluation and persist new semantic cache entries."""
+        super().flush()
+        if self.semantic_cache:
+            self.semantic_cache.flush()
+
+    def _lookup_cache(
+        self,
+        prompt: str,
+        system_prompt: str | None,
+        temperature: float,
+        max_tokens: int,
+    ) -> str | None:
+        """Return a semantically cached response (short-circuits the API call), if any."""
+        self.last_cache_hit = False
+        if not self.semantic_cache:
+            return None
+
+        cached = self.semantic_cache.lookup(
+            prompt, system_prompt, self.model_name, temperature, max_tokens
+        )
+        if not cached:
+            return None
+
+        # Lightweight stand-in so get_usage_info() keeps working
+        self._store_message(SimpleNamespace(usage=SimpleNamespace(**cached["usage"])))
+        self.last_cache_hit = True
+        return cached["response"]
+
+    def _handle_message(
+        self,
+        message: Any,
+        prompt: str,
+        system_prompt: str | None,
+        temperature: float,
+        max_tokens: int,
+    ) -> str:
+        """Store message for token extraction, cache it and return its text."""
+        self._store_message(message)
+
+        response = message.content[0].text
+
+        if self.semantic_cache:
+            self.semantic_cache.put(
+                prompt, system_prompt, self.model_name, temperature, max_tokens,
+                response=response,
+                usage=self.get_usage_info(),
+            )
+
+        return response
+
+    def _store_message(self, message: Any):
+        """Remember the last message, per asyncio task when running concurrently."""
+        self.last_message = message
+        task = self._current_task()
+        if task is not None:
+            self._task_messages[task] = message
+
+    @staticmethod
+    def _current_task() -> asyncio.Task | None:
+        """Return the running asyncio task, or None outside an event loop."""
+        try:
+            return asyncio.current_task()
+        except RuntimeError:
+            return None
+
+    def _split_at_breakpoint(self, text: str) -> tuple[str, str]:
+        """Split text into (static_prefix, dynamic_suffix) at the cache breakpoint (marker dropped)."""
+        if self.cache_breakpoint and self.cache_breakpoint in text:
+            static, dynamic = text.split(self.cache_breakpoint, 1)
+            return static, dynamic
+        return text, ""
+
+    @staticmethod
+    def _to_cached_blocks(static: str, dynamic: str) -> list[dict[str, Any]]:
+        """Build content blocks with a cache_control breakpoint after the static prefix."""
+        blocks = []
+        if static:
+            blocks.append({"type": "text", "text": static, "cache_control": {"type": "ephemeral"}})
+        if dynamic:
+            blocks.append({"type": "text", "text": dynamic})
+        return blocks
+
+    def _build_system(self, system_prompt: str | None) -> str | list[dict[str, Any]]:
+        """Build the system parameter, caching its static prefix when enabled."""
+        if not system_prompt:
+            return self._default_system
+        if not self.prompt_caching:
+            # Same text as with caching on: the marker is never sent
+            return "".join(self._split_at_breakpoint(system_prompt))
+
+        static, dynamic = self._split_at_breakpoint(system_prompt)
+        return self._to_cached_blocks(static, dynamic) or system_prompt
+
+    def _build_user_content(self, prompt: str) -> str | list[dict[str, Any]]:
+        """Build user content, caching a long preamble (e.g. retrieved context) before the breakpoint."""
+        if not self.cache_breakpoint or self.cache_breakpoint not in prompt:
+            return prompt
+        if not self.prompt_caching:
+            # Same text as with caching on: the marker is never sent
+            return "".join(self._split_at_breakpoint(prompt))
+
+        static, dynamic = self._split_at_breakpoint(prompt)
+        return self._to_cached_blocks(static, dynamic) or prompt
+
     def get_metadata(self) -> dict[str, Any]:
         """Return provider metadata."""
         return {
@@ -75,13 +352,21 @@ class ClaudeProvider(LLMProvider):
         }
 
     def get_usage_info(self) -> dict[str, int]:
-        """Extract token usage from last Claude message."""
-        if hasattr(self, 'last_message') and self.last_message:
-            usage = self.last_message.usage
+        """Extract token usage from last Claude message (of the current task, if any)."""
+        task = self._current_task()
+        message = self._task_messages.get(task, self.last_message) if task else self.last_message
+
+        if message is not None:
+            usage = message.usage
+            # Cache fields are None/absent when prompt caching was not involved
+            cache_creation = getattr(usage, "cache_creation_input_tokens", 0) or 0
+            cache_read = getattr(usage, "cache_read_input_tokens", 0) or 0
             return {
                 "input_tokens": usage.input_tokens,
                 "output_tokens": usage.output_tokens,
-                "total_tokens": usage.input_tokens + usage.output_tokens
+                "cache_creation_input_tokens": cache_creation,
+                "cache_read_input_tokens": cache_read,
+                "total_tokens": usage.input_tokens + cache_creation + cache_read + usage.output_tokens
             }
 
         # Fallback if no message available
@@ -19,60 +19,509 @@ The logic: If the answer is good, the question that ‘inspires’ it should be
 
 """
 
+import asyncio
+import functools
+import hashlib
+import json
+import math
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 from loguru import logger
 
+# Guards first construction of the process-wide evaluator (see _get_evaluator)
+_EVALUATOR_LOCK = threading.Lock()
 
-class RAGASEvaluator:
-    """RAGAS-based LLM response evaluator."""
+# Process-wide evaluation queue, built on first use (see get_evaluation_queue)
+_EVALUATION_QUEUE = None
+_EVALUATION_QUEUE_LOCK = threading.Lock()
+
+# Score columns RAGAS may return, in reporting order
+_METRIC_NAMES = ("answer_relevancy", "faithfulness", "answer_correctness", "context_precision")
+
+# Contexts row for samples without context (RAGAS requires the column)
+_EMPTY_CTX = [""]
+
+# Max prompt embeddings remembered by fast_mode relevance
+_PROMPT_EMB_CACHE_SIZE = 1024
+
+# metrics_used label of answer_relevancy computed without RAGAS (see direct_relevancy)
+_DIRECT_METRIC = "answer_relevancy_direct"
+
+# Below this many vectors plain numpy beats the SimSIMD call overhead
+_SIMSIMD_MIN_ROWS = 64
+
+# Reverse question generation used by the direct answer_relevancy computation
+_QUESTION_GENERATION_PROMPT = (
+    "Generate 3 questions that would have this answer. "
+    "Respond only with a JSON list of 3 strings.\n\n"
+    "Answer: {answer}"
+)
+
+
+def _cosine_similarities(matrix: Any, query: Any) -> Any:
+    """
+    Cosine similarity between each row of matrix and query.
 
-    def __init__(self):
-        """Initialize RAGAS evaluator with coherence and relevance metrics."""
+    Args:
+        matrix: 2D array-like (n_vectors x dim)
+        query: 1D array-like (dim)
+
+    Returns:
+        1D numpy array with one similarity per row
+    """
+    import numpy as np
+
+    matrix = np.asarray(matrix, dtype=np.float32)
+    query = np.asarray(query, dtype=np.float32).reshape(-1)
+
+    # SimSIMD (optional) pays off only once there are enough rows to amortize the call
+    if len(matrix) >= _SIMSIMD_MIN_ROWS:
         try:
-            from ragas import evaluate
-            from ragas.metrics import answer_relevancy, faithfulness
-            from datasets import Dataset
-            from langchain_openai import ChatOpenAI, OpenAIEmbeddings
-            import os
-
-            self.evaluate = evaluate
-            self.Dataset = Dataset
-
-            # Configure LLM and embeddings explicitly for RAGAS
-            api_key = os.getenv("OPENAI_API_KEY")
-            if not api_key:
-                logger.warning("⚠️ OPENAI_API_KEY not set - RAGAS evaluation may fail")
-                self.llm = None
-                self.embeddings = None
-            else:
-                # Use modern OpenAI API with explicit configuration
-                self.llm = ChatOpenAI(
-                    model="gpt-3.5-turbo",
-                    api_key=api_key,
-                    temperature=0
+            import simsimd
+            return 1.0 - np.asarray(simsimd.cdist(query[np.newaxis, :], matrix, metric="cosine")).reshape(-1)
+        except ImportError:
+            pass
+
+    norms = np.sqrt(np.einsum("ij,ij->i", matrix, matrix) * np.dot(query, query))
+    return (matrix @ query) / norms
+
+
+def _patch_answer_relevancy(metric: Any):
+    """
+    Replace the answer_relevancy similarity step with _cosine_similarities.
+
+    RAGAS computes the cosine between the original question and the generated
+    questions with np.linalg.norm over (n, 1)-shaped arrays; this swaps in the
+    einsum/SimSIMD version on the metric instance. Metrics without a
+    calculate_similarity method (other RAGAS releases) are left untouched.
+
+    Args:
+        metric: RAGAS answer_relevancy metric instance
+    """
+    if not hasattr(metric, "calculate_similarity") or getattr(metric, "_fast_similarity", False):
+        return
+
+    def calculate_similarity(question: str, generated_questions: list[str]) -> Any:
+        embeddings = metric.embeddings
+        question_vec = embeddings.embed_query(question)
+        gen_question_vecs = embeddings.embed_documents(generated_questions)
+        return _cosine_similarities(gen_question_vecs, question_vec)
+
+    try:
+        object.__setattr__(metric, "calculate_similarity", calculate_similarity)
+        object.__setattr__(metric, "_fast_similarity", True)
+    except (AttributeError, TypeError) as e:
+        logger.warning(f"⚠️ Could not patch answer_relevancy similarity: {e}")
+
+
+@functools.lru_cache(maxsize=None)
+def _lazy_imports() -> SimpleNamespace:
+    """
+    Import ragas, datasets and langchain-openai (once per process).
+
+    These imports take well over 500ms, so they are deferred until the first
+    evaluation instead of running when the evaluator is constructed. A failed
+    import is not cached by lru_cache, the caller keeps its own sentinel.
+
+    Returns:
+        Namespace with the RAGAS entry point, metrics, datasets types and
+        langchain clients
+
+    Raises:
+        ImportError: If RAGAS dependencies are not installed
+    """
+    import ragas
+    from ragas import evaluate
+    from ragas.metrics import (
+        answer_relevancy,
+        faithfulness,
+        answer_correctness,
+        context_precision
+    )
+    import datasets
+    from datasets import Dataset
+    import pyarrow as pa
+    from langchain_openai import ChatOpenAI, OpenAIEmbeddings
+
+    # RunConfig is not available in older RAGAS releases
+    try:
+        from ragas.run_config import RunConfig
+    except ImportError:
+        RunConfig = None
+
+    # Evaluation datasets are consumed once: no Arrow cache files or progress bars
+    datasets.disable_caching()
+    disable_progress_bars = getattr(datasets, "disable_progress_bars", None) or getattr(
+        datasets, "disable_progress_bar", None
+    )
+    if disable_progress_bars:
+        disable_progress_bars()
+
+    _patch_answer_relevancy(answer_relevancy)
+
+    return SimpleNamespace(
+        ragas=ragas,
+        evaluate=evaluate,
+        RunConfig=RunConfig,
+        answer_relevancy=answer_relevancy,
+        faithfulness=faithfulness,
+        answer_correctness=answer_correctness,
+        context_precision=context_precision,
+        Dataset=Dataset,
+        pa=pa,
+        ChatOpenAI=ChatOpenAI,
+        OpenAIEmbeddings=OpenAIEmbeddings,
+    )
+
+
+def _error_result(error: str) -> dict[str, Any]:
+    """Build the evaluation result returned when no scores could be produced."""
+    return {
+        "relevance": None,
+        "coherence": None,
+        "correctness": None,
+        "context_quality": None,
+        "overall_score": None,
+        "error": error,
+        "metrics_used": [],
+    }
+
+
+def _rows_from_pandas(results: Any) -> list[dict[str, Any]]:
+    """Rows from EvaluationResult.to_pandas() (RAGAS 0.4.x uses to_pandas() instead of to_dict())."""
+    df = results.to_pandas()
+    if len(df) == 0:
+        raise ValueError("Empty results from RAGAS evaluation")
+    # Round all score columns at once (vectorized) instead of per score in _row_to_result
+    columns = [name for name in _METRIC_NAMES if name in df.columns]
+    df[columns] = df[columns].round(3)
+    return df.to_dict(orient='records')
+
+
+def _empty_response_result(has_context: bool, has_ground_truth: bool) -> dict[str, Any]:
+    """Build the (all zero) evaluation result for an empty response."""
+    metrics_used = ["answer_relevancy"]
+    if has_context:
+        metrics_used.append("faithfulness")
+    if has_ground_truth:
+        metrics_used.append("answer_correctness")
+    if has_context and has_ground_truth:
+        metrics_used.append("context_precision")
+
+    return {
+        "relevance": 0.0,
+        "coherence": 0.0 if has_context else None,
+        "correctness": 0.0 if has_ground_truth else None,
+        "context_quality": 0.0 if has_context and has_ground_truth else None,
+        "overall_score": 0.0,
+        "metrics_used": metrics_used,
+    }
+
+
+# Memory-hit accessed_at updates written to sqlite at once (see EvaluationCache.get)
+_TOUCH_BATCH_SIZE = 64
+
+
+class EvaluationCache:
+    """
+    Content-addressed LRU cache of evaluation results.
+
+    Results are kept in memory and persisted to a sqlite file so that reruns
+    (dev loops, CI) reuse scores of samples that were already evaluated. Keys
+    include the judge and embedding models, so changing either invalidates
+    previous scores. Entries expire after `ttl` seconds and the least recently
+    used ones are evicted beyond `max_entries`.
+    """
+
+    def __init__(self, path: str | Path, ttl: float = 7 * 86400, max_entries: int = 10_000):
+        """
+        Initialize cache.
+
+        Args:
+            path: sqlite file used for persistence
+            ttl: Seconds before an entry expires (default: 7 days)
+            max_entries: Maximum entries kept (default: 10000)
+        """
+        self.path = Path(path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._memory: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._touched: dict[str, float] = {}  # Memory hits not yet recorded in sqlite
+        self._conn = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(
+        prompt: str,
+        response: str,
+        context: str | None = None,
+        ground_truth: str | None = None,
+        judge_model: str = "",
+        embedding_model: str = ""
+    ) -> str:
+        """Hash (judge/embedding models, prompt, response, context, ground_truth) into a cache key."""
+        digest = hashlib.blake2b(digest_size=16)
+        for part in (judge_model, embedding_model, prompt, response, context or "", ground_truth or ""):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")  # Field separator
+        return digest.hexdigest()
+
+    def _connect(self):
+        """Open (once) the sqlite file, creating the table if needed."""
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS evaluations ("
+                "key TEXT PRIMARY KEY, result TEXT NOT NULL, "
+                "created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+        return self._conn
+
+    def _flush_touches(self, conn):
+        """Write pending accessed_at updates of memory hits (caller holds the lock and commits)."""
+        if self._touched:
+            conn.executemany(
+                "UPDATE evaluations SET accessed_at = ? WHERE key = ?",
+                [(accessed_at, key) for key, accessed_at in self._touched.items()]
+            )
+            self._touched.clear()
+
+    def _remember(self, key: str, created_at: float, result: dict[str, Any]):
+        """Keep an entry in the in-memory LRU."""
+        self._memory[key] = (created_at, result)
+        self._memory.move_to_end(key)
+        if len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached result for key, or None (missing or expired)."""
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and now - entry[0] <= self.ttl:
+                self._memory.move_to_end(key)
+                # Keep sqlite's LRU order in step, batched to avoid a write per hit
+                self._touched[key] = now
+                if len(self._touched) >= _TOUCH_BATCH_SIZE:
+                    try:
+                        conn = self._connect()
+                        self._flush_touches(conn)
+                        conn.commit()
+                    except Exception as e:
+                        logger.warning(f"⚠️ Evaluation cache write failed: {e}")
+                return entry[1]
+
+            try:
+                conn = self._connect()
+                row = conn.execute(
+                    "SELECT result, created_at FROM evaluations WHERE key = ?", (key,)
+                ).fetchone()
+
+                if row is None:
+                    return None
+
+                if now - row[1] > self.ttl:
+                    conn.execute("DELETE FROM evaluations WHERE key = ?", (key,))
+                    conn.commit()
+                    self._memory.pop(key, None)
+                    return None
+
+                conn.execute("UPDATE evaluations SET accessed_at = ? WHERE key = ?", (now, key))
+                conn.commit()
+            except Exception as e:
+                logger.warning(f"⚠️ Evaluation cache read failed: {e}")
+                return None
+
+            result = json.loads(row[0])
+            self._remember(key, row[1], result)
+            return result
+
+    def set(self, key: str, result: dict[str, Any]):
+        """Store result under key (memory + disk), evicting least recently used entries."""
+        now = time.time()
+
+        with self._lock:
+            self._remember(key, now, result)
+            try:
+                conn = self._connect()
+                # Pending memory hits first, so eviction sees their recent use
+                self._flush_touches(conn)
+                conn.execute(
+                    "INSERT OR REPLACE INTO evaluations (key, result, created_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?)",
+                    (key, json.dumps(result), now, now)
                 )
-                self.embeddings = OpenAIEmbeddings(
-                    model="text-embedding-3-small",
-                    api_key=api_key
+                conn.execute(
+                    "DELETE FROM evaluations WHERE key IN ("
+                    "SELECT key FROM evaluations ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_entries,)
                 )
+                conn.commit()
+            except Exception as e:
+                logger.warning(f"⚠️ Evaluation cache write failed: {e}")
 
-            # Use available metrics (coherence might not be directly available)
-            # We'll use answer_relevancy and faithfulness as proxies
-            self.metrics = [answer_relevancy, faithfulness]
 
-        except ImportError as e:
-            logger.error(
-                f"❌ RAGAS dependencies not installed: {e}\n"
-                "Install with: pip install ragas datasets langchain-openai"
-            )
-            raise
+class RAGASEvaluator:
+    """RAGAS-based LLM response evaluator."""
+
+    def __init__(
+        self,
+        cache_dir: str | None = None,
+        max_workers: int = 16,
+        judge_model: str | None = None,
+        embedding_model: str | None = None,
+        embedding_dimensions: int | None = 512,
+        direct_relevancy: bool | None = None,
+        enable_cache: bool | None = None
+    ):
+        """
+        Initialize RAGAS evaluator (heavy dependencies are loaded on first evaluation).
+
+        Args:
+            cache_dir: Directory for the persisted evaluation cache
+                (default: RAGAS_CACHE_DIR env var or ".cache")
+            max_workers: Max concurrent LLM/embedding calls inside one RAGAS run (default: 16)
+            judge_model: OpenAI model used as RAGAS judge
+                (default: RAGAS_JUDGE_MODEL env var or gpt-4o-mini)
+            embedding_model: OpenAI embedding model used for similarity
+                (default: RAGAS_EMBEDDING_MODEL env var or text-embedding-3-small)
+            embedding_dimensions: Truncated embedding size for text-embedding-3-* models
+                (default: 512, ~3x less to transfer and compare than 1536 for a small
+                recall hit; None keeps the full size)
+            direct_relevancy: Score relevancy-only samples (no context/ground truth)
+                with one judge call + one embedding call each instead of RAGAS.
+                Cheaper, but reported as "answer_relevancy_direct": it skips the
+                RAGAS noncommittal penalty and is not comparable
+                (default: RAGAS_DIRECT_RELEVANCY env var, off)
+            enable_cache: Reuse scores of samples already evaluated (default: on
+                unless the RAGAS_CACHE env var is 0/false/no)
+        """
+        # Score cache, disabled with enable_cache=False or RAGAS_CACHE=0
+        if enable_cache is None:
+            enable_cache = os.getenv("RAGAS_CACHE", "1").lower() not in ("0", "false", "no")
+        cache_dir = cache_dir or os.getenv("RAGAS_CACHE_DIR", ".cache")
+        self.cache = EvaluationCache(Path(cache_dir) / "ragas_scores.sqlite") if enable_cache else None
+        self.max_workers = max_workers
+        if direct_relevancy is None:
+            direct_relevancy = os.getenv("RAGAS_DIRECT_RELEVANCY", "").lower() in ("1", "true", "yes")
+        self.direct_relevancy = direct_relevancy
+
+        # Judge models (part of the cache key, so resolved before any import)
+        self.judge_model = judge_model or os.getenv("RAGAS_JUDGE_MODEL", "gpt-4o-mini")
+        self.embedding_model = embedding_model or os.getenv("RAGAS_EMBEDDING_MODEL", "text-embedding-3-small")
+        # Only text-embedding-3-* models accept the dimensions parameter
+        self.embedding_dimensions = (
+            embedding_dimensions if self.embedding_model.startswith("text-embedding-3") else None
+        )
+        self._embedding_key = (
+            f"{self.embedding_model}@{self.embedding_dimensions}"
+            if self.embedding_dimensions else self.embedding_model
+        )
+        self._ragas = None
+        self._load_error = None  # ImportError from the first load attempt, re-raised afterwards
+        self._load_lock = threading.Lock()
+
+        # prompt -> embedding for fast_mode, LRU-evicted (see _fast_relevance)
+        self._prompt_emb_cache: OrderedDict[str, Any] = OrderedDict()
+        self._prompt_emb_lock = threading.Lock()
+
+    def _ensure_loaded(self):
+        """Import ragas/datasets/langchain and configure LLM, embeddings and metrics (once)."""
+        if self._ragas is not None:
+            return
+
+        with self._load_lock:
+            if self._ragas is not None:
+                return
+
+            # Don't retry (slow) imports that already failed in this process
+            if self._load_error is not None:
+                raise self._load_error
+
+            try:
+                mods = _lazy_imports()
+
+                self.evaluate = mods.evaluate
+                self.Dataset = mods.Dataset
+                self.RunConfig = mods.RunConfig
+
+                # Fixed Arrow schemas skip per-row type inference (keyed by has_ground_truth)
+                pa = mods.pa
+                base_fields = [
+                    ("question", pa.string()),
+                    ("answer", pa.string()),
+                    ("contexts", pa.list_(pa.string())),
+                ]
+                self.Table = pa.Table
+                self.schemas = {
+                    False: pa.schema(base_fields),
+                    True: pa.schema(base_fields + [("ground_truth", pa.string())]),
+                }
+
+                # Configure LLM and embeddings explicitly for RAGAS
+                api_key = os.getenv("OPENAI_API_KEY")
+                if not api_key:
+                    logger.warning("⚠️ OPENAI_API_KEY not set - RAGAS evaluation may fail")
+                    self.llm = None
+                    self.embeddings = None
+                else:
+                    from .http_client import build_async_http_client, build_http_client
+
+                    # Use modern OpenAI API with explicit configuration. RAGAS scores
+                    # through ascore/agenerate_prompt, i.e. the async client, and fans
+                    # out many judge/embedding calls at once: pool both (HTTP/2);
+                    # the sync client serves direct_relevancy's invoke/embed calls
+                    self.llm = mods.ChatOpenAI(
+                        model=self.judge_model,
+                        api_key=api_key,
+                        temperature=0,
+                        http_client=build_http_client(),
+                        http_async_client=build_async_http_client()
+                    )
+                    self.embeddings = mods.OpenAIEmbeddings(
+                        model=self.embedding_model,
+                        dimensions=self.embedding_dimensions,
+                        api_key=api_key,
+                        http_client=build_http_client(),
+                        http_async_client=build_async_http_client()
+                    )
+
+                # Use available metrics (coherence might not be directly available)
+                # We'll use answer_relevancy and faithfulness as proxies
+                self.metrics = [mods.answer_relevancy, mods.faithfulness]
+
+                # Bound once so evaluate_response doesn't re-import them per call
+                self.answer_relevancy = mods.answer_relevancy
+                self.faithfulness = mods.faithfulness
+                self.answer_correctness = mods.answer_correctness
+                self.context_precision = mods.context_precision
+
+                self._ragas = mods.ragas
+
+            except ImportError as e:
+                self._load_error = e
+                logger.error(
+                    f"❌ RAGAS dependencies not installed: {e}\n"
+                    "Install with: pip install ragas datasets langchain-openai"
+                )
+                raise
 
     def evaluate_response(
         self,
         prompt: str,
         response: str,
         context: str | None = None,
-        ground_truth: str | None = None
+        ground_truth: str | None = None,
+        fast_mode: bool = False
     ) -> dict[str, Any]:
         """
         Evaluate response using RAGAS metrics (adaptive based on available data).
@@ -88,6 +537,9 @@ class RAGASEvaluator:
             response: LLM generated response
             context: Optional context. If provided, enables faithfulness metric.
             ground_truth: Optional reference answer. If provided, enables answer_correctness.
+            fast_mode: Triage mode - relevance is the cosine similarity between prompt
+                and response embeddings (one embedding call, no judge LLM). Context and
+                ground truth are ignored, so there is no hallucination/correctness check.
 
         Returns:
             Dict with evaluation scores:
@@ -102,194 +554,654 @@ class RAGASEvaluator:
 
         Note: Metrics adapt based on available data. See METRIC_SELECTION.md for details.
         """
-        try:
-            from ragas.metrics import (
-                answer_relevancy,
-                faithfulness,
-                answer_correctness,
-                context_precision
-            )
+        return self.evaluate_batch([{
+            "prompt": prompt,
+            "response": response,
+            "context": context,
+            "ground_truth": ground_truth,
+            "fast_mode": fast_mode,
+        }])[0]
 
-            # Determine available metrics based on provided data
-            metrics_to_use = [answer_relevancy]  # Always available
-            has_context = context and context.strip()
-            has_ground_truth = ground_truth and ground_truth.strip()
+    def evaluate_batch(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """
+        Evaluate several responses with as few `ragas.evaluate` calls as possible.
 
-            # Build dataset base
-            data = {
-                "question": [prompt],
-                "answer": [response],
-            }
+        Items are grouped by the metrics they enable (context and/or ground truth
+        present) and each group is scored with a single multi-row dataset, letting
+        RAGAS parallelize LLM/embedding calls across rows. Empty responses and
+        samples already scored (see EvaluationCache) skip RAGAS entirely.
 
-            # Add context if exists (enables faithfulness and context_precision)
-            if has_context:
-                data["contexts"] = [[context]]
-                metrics_to_use.append(faithfulness)
+        Args:
+            items: List of dicts with keys "prompt", "response" and optional
+                "context", "ground_truth" and "fast_mode" (see evaluate_response)
+
+        Returns:
+            List of evaluation result dicts (same format as evaluate_response),
+            in the same order as items
+
+        Raises:
+            ImportError: If RAGAS dependencies are not installed
+        """
+        results: list[dict[str, Any] | None] = [None] * len(items)
+        keys: dict[int, str] = {}
+        fast_indices: list[int] = []
+        direct_indices: list[int] = []
+
+        # Group row indices by available data (each group shares one metric set)
+        groups: dict[tuple[bool, bool], list[int]] = {}
+
+        for index, item in enumerate(items):
+            fast_mode = item.get("fast_mode", False)
+            context = None if fast_mode else item.get("context")
+            ground_truth = None if fast_mode else item.get("ground_truth")
+            has_context = bool(context and not context.isspace())
+            has_ground_truth = bool(ground_truth and not ground_truth.isspace())
+
+            # Empty responses trivially score 0 on every metric
+            if not item["response"] or item["response"].isspace():
+                results[index] = _empty_response_result(has_context, has_ground_truth)
+                continue
+
+            # The scoring method is part of the key: direct and RAGAS scores differ
+            if fast_mode:
+                method = "embedding-only"
+            elif self.direct_relevancy and not has_context and not has_ground_truth:
+                method = f"{self.judge_model}/direct"
             else:
-                # RAGAS requires contexts even if empty
-                data["contexts"] = [[""]]
-
-            # Add ground_truth if exists (enables answer_correctness)
-            if has_ground_truth:
-                data["ground_truth"] = [ground_truth]
-                metrics_to_use.append(answer_correctness)
-
-                # Add context_precision only if BOTH context and ground_truth exist
-                if has_context:
-                    metrics_to_use.append(context_precision)
-
-            dataset = self.Dataset.from_dict(data)
-
-            # Evaluar con métricas disponibles y LLM/embeddings explícitos
-            if self.llm and self.embeddings:
-                results = self.evaluate(
-                    dataset,
-                    metrics=metrics_to_use,
-                    llm=self.llm,
-                    embeddings=self.embeddings
-                )
+                method = self.judge_model
+
+            # Identical samples produce identical (temperature 0) scores
+            key = EvaluationCache.make_key(
+                item["prompt"], item["response"], context, ground_truth,
+                judge_model=method,
+                embedding_model=self._embedding_key
+            )
+            cached = self.cache.get(key) if self.cache else None
+            if cached is not None:
+                results[index] = cached
+                continue
+
+            keys[index] = key
+            if fast_mode:
+                fast_indices.append(index)
+            elif method != self.judge_model:
+                direct_indices.append(index)
             else:
-                # Fallback sin configuración explícita (puede fallar)
-                logger.warning("⚠️ Evaluating without explicit LLM/embeddings configuration")
-                results = self.evaluate(dataset, metrics=metrics_to_use)
+                groups.setdefault((has_context, has_ground_truth), []).append(index)
+
+        if groups or fast_indices or direct_indices:
+            self._ensure_loaded()
 
-            # Convertir a dict (FIX PRINCIPAL del error .get())
+        for index in fast_indices:
             try:
-                # RAGAS 0.4.x uses to_pandas() instead of to_dict()
-                if hasattr(results, 'to_pandas'):
-                    df = results.to_pandas()
-                    if len(df) > 0:
-                        results_dict = df.iloc[0].to_dict()
-                    else:
-                        raise ValueError("Empty results from RAGAS evaluation")
-                elif hasattr(results, 'scores'):
-                    # Direct access to scores attribute
-                    results_dict = results.scores.iloc[0].to_dict() if hasattr(results.scores, 'iloc') else dict(results.scores)
-                elif hasattr(results, '__getitem__'):
-                    # Fallback: acceso por índice
-                    results_dict = {}
-                    if "answer_relevancy" in results:
-                        val = results["answer_relevancy"]
-                        results_dict["answer_relevancy"] = float(val[0]) if hasattr(val, '__getitem__') else float(val)
-                    if "faithfulness" in results:
-                        val = results["faithfulness"]
-                        results_dict["faithfulness"] = float(val[0]) if hasattr(val, '__getitem__') else float(val)
-                else:
-                    raise AttributeError("Cannot convert EvaluationResult to dict")
-            except Exception as conv_error:
-                logger.warning(f"⚠️ Error converting results: {conv_error}")
-                logger.warning(f"Results type: {type(results)}")
-                if hasattr(results, 'scores'):
-                    logger.warning(f"Scores available: {results.scores}")
-                # Last resort: return default values
-                results_dict = {"answer_relevancy": 0.0}
-
-            # Extract available scores
-            relevance_score = float(results_dict.get("answer_relevancy", 0.0))
-
-            # Verify evaluation worked
-            if relevance_score == 0.0 and "answer_relevancy" not in results_dict:
-                logger.warning("⚠️ RAGAS evaluation produced no valid scores - check OpenAI API key and connectivity")
-                return {
-                    "relevance": None,
-                    "coherence": None,
-                    "correctness": None,
-                    "context_quality": None,
-                    "overall_score": None,
-                    "error": "RAGAS evaluation failed - no valid scores produced. Check OpenAI API key and logs.",
-                    "metrics_used": [],
-                }
+                results[index] = self._fast_relevance_result(items[index]["prompt"], items[index]["response"])
+            except Exception as e:
+                logger.error(f"❌ Fast relevance evaluation failed: {e}")
+                results[index] = _error_result(str(e))
+
+        for index in direct_indices:
+            try:
+                results[index] = self._direct_relevancy_result(items[index]["prompt"], items[index]["response"])
+            except Exception as e:
+                logger.warning(f"⚠️ Direct answer_relevancy failed ({e}), falling back to RAGAS")
+                groups.setdefault((False, False), []).append(index)
+
+        for (has_context, has_ground_truth), indices in groups.items():
+            try:
+                group_results = self._evaluate_group(
+                    [items[i] for i in indices], has_context, has_ground_truth
+                )
+            except Exception as e:
+                logger.error(f"❌ RAGAS evaluation failed: {e}")
+                group_results = [_error_result(str(e)) for _ in indices]
+
+            for index, result in zip(indices, group_results):
+                results[index] = result
+
+        for index, key in keys.items():
+            result = results[index]
+            # A direct-path sample that fell back to RAGAS must not be cached under the direct key
+            if "error" not in result and (index not in direct_indices or _DIRECT_METRIC in result["metrics_used"]):
+                if self.cache:
+                    self.cache.set(key, result)
+
+        return results
+
+    def evaluate_responses(
+        self,
+        items: list[dict[str, Any]],
+        fast_mode: bool = False
+    ) -> list[dict[str, Any]]:
+        """
+        Evaluate several (question, answer) samples in as few RAGAS runs as possible.
+
+        Args:
+            items: List of dicts with keys "question", "answer" and optional
+                "context", "ground_truth" and "fast_mode" (overrides fast_mode)
+            fast_mode: Embedding-only relevance triage for every item (see evaluate_response)
 
-            # Extract scores for metrics that were evaluated
-            coherence_score = None
-            correctness_score = None
-            context_quality_score = None
-            scores_for_average = [relevance_score]
-            metrics_used = ["answer_relevancy"]
-
-            # Faithfulness (coherence) - only if context provided
-            if has_context and "faithfulness" in results_dict:
-                coherence_score = float(results_dict.get("faithfulness", 0.0))
-                scores_for_average.append(coherence_score)
-                metrics_used.append("faithfulness")
-
-            # Answer correctness - only if ground_truth provided
-            if has_ground_truth and "answer_correctness" in results_dict:
-                correctness_score = float(results_dict.get("answer_correctness", 0.0))
-                scores_for_average.append(correctness_score)
-                metrics_used.append("answer_correctness")
-
-            # Context precision - only if both context and ground_truth provided
-            if has_context and has_ground_truth and "context_precision" in results_dict:
-                context_quality_score = float(results_dict.get("context_precision", 0.0))
-                scores_for_average.append(context_quality_score)
-                metrics_used.append("context_precision")
-
-            # Calculate overall score as average of available metrics
-            overall_score = sum(scores_for_average) / len(scores_for_average)
-
-            # Log results
-            log_parts = [f"relevancy={relevance_score:.3f}"]
-            if coherence_score is not None:
-                log_parts.append(f"faithfulness={coherence_score:.3f}")
-            if correctness_score is not None:
-                log_parts.append(f"correctness={correctness_score:.3f}")
-            if context_quality_score is not None:
-                log_parts.append(f"context_precision={context_quality_score:.3f}")
-
-            logger.info(f"📊 Evaluation complete: {', '.join(log_parts)}")
-
-            return {
-                "relevance": round(relevance_score, 3),
-                "coherence": round(coherence_score, 3) if coherence_score is not None else None,
-                "correctness": round(correctness_score, 3) if correctness_score is not None else None,
-                "context_quality": round(context_quality_score, 3) if context_quality_score is not None else None,
-                "overall_score": round(overall_score, 3),
-                "metrics_used": metrics_used,
+        Returns:
+            List of evaluation result dicts, in the same order as items
+        """
+        return self.evaluate_batch([
+            {
+                "prompt": item["question"],
+                "response": item["answer"],
+                "context": item.get("context"),
+                "ground_truth": item.get("ground_truth"),
+                "fast_mode": item.get("fast_mode", fast_mode),
             }
+            for item in items
+        ])
+
+    async def evaluate_response_async(
+        self,
+        prompt: str,
+        response: str,
+        context: str | None = None,
+        ground_truth: str | None = None,
+        fast_mode: bool = False
+    ) -> dict[str, Any]:
+        """
+        Async variant of evaluate_response for callers running an event loop.
+
+        RAGAS drives its own event loop internally, so the evaluation runs in a
+        worker thread instead of blocking (or nesting inside) the caller's loop.
+        """
+        return await asyncio.to_thread(
+            self.evaluate_response, prompt, response, context, ground_truth, fast_mode
+        )
+
+    async def evaluate_responses_async(
+        self,
+        items: list[dict[str, Any]],
+        fast_mode: bool = False
+    ) -> list[dict[str, Any]]:
+        """
+        Async variant of evaluate_responses.
+
+        The whole batch is offloaded in one worker thread, so it keeps the
+        grouping into multi-row RAGAS runs (RAGAS parallelizes rows itself).
+
+        Args:
+            items: List of dicts with keys "question", "answer" and optional
+                "context", "ground_truth" and "fast_mode" (overrides fast_mode)
+            fast_mode: Embedding-only relevance triage for every item (see evaluate_response)
+
+        Returns:
+            List of evaluation result dicts, in the same order as items
+        """
+        return await asyncio.to_thread(self.evaluate_responses, items, fast_mode)
+
+    def _evaluate_group(
+        self,
+        items: list[dict[str, Any]],
+        has_context: bool,
+        has_ground_truth: bool
+    ) -> list[dict[str, Any]]:
+        """Evaluate items sharing the same available data with one RAGAS call."""
+        # Determine available metrics based on provided data
+        metrics_to_use = [self.answer_relevancy]  # Always available
+
+        # Build dataset base
+        data = {
+            "question": [item["prompt"] for item in items],
+            "answer": [item["response"] for item in items],
+        }
+
+        # Add context if exists (enables faithfulness and context_precision)
+        if has_context:
+            data["contexts"] = [[item["context"]] for item in items]
+            metrics_to_use.append(self.faithfulness)
+        else:
+            # RAGAS requires contexts even if empty (shared row, copied into Arrow)
+            data["contexts"] = [_EMPTY_CTX] * len(items)
+
+        # Add ground_truth if exists (enables answer_correctness)
+        if has_ground_truth:
+            data["ground_truth"] = [item["ground_truth"] for item in items]
+            metrics_to_use.append(self.answer_correctness)
+
+            # Add context_precision only if BOTH context and ground_truth exist
+            if has_context:
+                metrics_to_use.append(self.context_precision)
+
+        # Build the Arrow table directly and wrap it (no Dataset.from_dict inference/copies)
+        dataset = self.Dataset(self.Table.from_pydict(data, schema=self.schemas[has_ground_truth]))
+
+        # RAGAS parallelizes rows internally, bounded by max_workers
+        run_options = {}
+        if self.RunConfig is not None:
+            run_options["run_config"] = self.RunConfig(max_workers=self.max_workers)
+
+        # Evaluar con métricas disponibles y LLM/embeddings explícitos
+        if self.llm and self.embeddings:
+            results = self.evaluate(
+                dataset,
+                metrics=metrics_to_use,
+                llm=self.llm,
+                embeddings=self.embeddings,
+                **run_options
+            )
+        else:
+            # Fallback sin configuración explícita (puede fallar)
+            logger.warning("⚠️ Evaluating without explicit LLM/embeddings configuration")
+            results = self.evaluate(dataset, metrics=metrics_to_use, **run_options)
+
+        # Convertir a dicts, una fila por item (FIX PRINCIPAL del error .get())
+        # Conversion errors propagate: the group gets error results instead of fake zeros
+        rows = _rows_from_pandas(results)
+
+        return [self._row_to_result(row, has_context, has_ground_truth) for row in rows]
+
+    def _fast_relevance(self, prompt: str, response: str) -> float:
+        """
+        Embedding-only relevance proxy: cosine similarity of prompt and response.
+
+        Args:
+            prompt: User prompt/question
+            response: LLM generated response
+
+        Returns:
+            Cosine similarity between both embeddings
+        """
+        import numpy as np
+
+        # Prompts are often scored against many responses: embed each prompt once
+        with self._prompt_emb_lock:
+            a = self._prompt_emb_cache.get(prompt)
+            if a is not None:
+                self._prompt_emb_cache.move_to_end(prompt)
+
+        if a is not None:
+            b = np.asarray(self.embeddings.embed_documents([response])[0], dtype=np.float32)
+        else:
+            a, b = (np.asarray(v, dtype=np.float32) for v in self.embeddings.embed_documents([prompt, response]))
+            with self._prompt_emb_lock:
+                self._prompt_emb_cache[prompt] = a
+                if len(self._prompt_emb_cache) > _PROMPT_EMB_CACHE_SIZE:
+                    self._prompt_emb_cache.popitem(last=False)
+
+        return float(np.dot(a, b) / math.sqrt(np.vdot(a, a) * np.vdot(b, b)))
+
+    def _fast_relevance_result(self, prompt: str, response: str) -> dict[str, Any]:
+        """Build the fast_mode evaluation result (relevance only)."""
+        if not self.embeddings:
+            raise ValueError("fast_mode requires OPENAI_API_KEY for embeddings")
+
+        relevance_score = self._fast_relevance(prompt, response)
+        logger.info(f"📊 Fast evaluation complete: embedding_similarity={relevance_score:.3f}")
+
+        return {
+            "relevance": round(relevance_score, 3),
+            "coherence": None,
+            "correctness": None,
+            "context_quality": None,
+            "overall_score": round(relevance_score, 3),
+            "metrics_used": ["embedding_similarity"],
+        }
+
+    def _direct_relevancy_result(self, prompt: str, response: str) -> dict[str, Any]:
+        """Build the direct_relevancy evaluation result (answer_relevancy without RAGAS)."""
+        if not (self.llm and self.embeddings):
+            raise ValueError("direct_relevancy requires OPENAI_API_KEY for the judge and embeddings")
+
+        score = self._fast_answer_relevancy(prompt, response)
+        result = self._row_to_result({"answer_relevancy": round(score, 3)}, False, False)
+        result["metrics_used"] = [_DIRECT_METRIC]
+        return result
+
+    def _fast_answer_relevancy(self, prompt: str, response: str) -> float:
+        """
+        Compute answer_relevancy directly, without dataset construction or RAGAS.
+
+        Same idea as RAGAS: generate questions from the answer and average their
+        cosine similarity to the original question (one batched embedding call).
+
+        Args:
+            prompt: User prompt/question
+            response: LLM generated response
+
+        Returns:
+            answer_relevancy score
+        """
+        reply = self.llm.invoke(_QUESTION_GENERATION_PROMPT.format(answer=response)).content
+
+        # Tolerate code fences or prose around the JSON list
+        questions = json.loads(reply[reply.index("["):reply.rindex("]") + 1])
+        questions = [str(q) for q in questions if str(q).strip()][:3]
+        if not questions:
+            raise ValueError("No questions generated")
+
+        vectors = self.embeddings.embed_documents(questions + [prompt])
+        return float(_cosine_similarities(vectors[:-1], vectors[-1]).mean())
+
+    @staticmethod
+    def _row_to_result(
+        results_dict: dict[str, Any],
+        has_context: bool,
+        has_ground_truth: bool
+    ) -> dict[str, Any]:
+        """
+        Turn one row of RAGAS scores into the evaluation result format.
+
+        Scores are expected already rounded to 3 decimals by the rows extractor.
+        """
+        # Extract available scores
+        relevance_score = float(results_dict.get("answer_relevancy", 0.0))
+
+        # Verify evaluation worked
+        if relevance_score == 0.0 and "answer_relevancy" not in results_dict:
+            logger.warning("⚠️ RAGAS evaluation produced no valid scores - check OpenAI API key and connectivity")
+            return _error_result(
+                "RAGAS evaluation failed - no valid scores produced. Check OpenAI API key and logs."
+            )
+
+        # Extract scores for metrics that were evaluated
+        coherence_score = None
+        correctness_score = None
+        context_quality_score = None
+        scores_for_average = [relevance_score]
+        metrics_used = ["answer_relevancy"]
+
+        # Faithfulness (coherence) - only if context provided
+        if has_context and "faithfulness" in results_dict:
+            coherence_score = float(results_dict.get("faithfulness", 0.0))
+            scores_for_average.append(coherence_score)
+            metrics_used.append("faithfulness")
+
+        # Answer correctness - only if ground_truth provided
+        if has_ground_truth and "answer_correctness" in results_dict:
+            correctness_score = float(results_dict.get("answer_correctness", 0.0))
+            scores_for_average.append(correctness_score)
+            metrics_used.append("answer_correctness")
+
+        # Context precision - only if both context and ground_truth provided
+        if has_context and has_ground_truth and "context_precision" in results_dict:
+            context_quality_score = float(results_dict.get("context_precision", 0.0))
+            scores_for_average.append(context_quality_score)
+            metrics_used.append("context_precision")
+
+        # Calculate overall score as average of available metrics
+        overall_score = sum(scores_for_average) / len(scores_for_average)
+
+        # Log results
+        log_parts = [f"relevancy={relevance_score:.3f}"]
+        if coherence_score is not None:
+            log_parts.append(f"faithfulness={coherence_score:.3f}")
+        if correctness_score is not None:
+            log_parts.append(f"correctness={correctness_score:.3f}")
+        if context_quality_score is not None:
+            log_parts.append(f"context_precision={context_quality_score:.3f}")
+
+        logger.info(f"📊 Evaluation complete: {', '.join(log_parts)}")
+
+        return {
+            "relevance": relevance_score,
+            "coherence": coherence_score,
+            "correctness": correctness_score,
+            "context_quality": context_quality_score,
+            "overall_score": round(overall_score, 3),
+            "metrics_used": metrics_used,
+        }
+
+
+# Sentinel telling the EvaluationQueue worker to flush and stop
+_STOP = object()
+
+
+class EvaluationQueue:
+    """
+    Accumulates evaluation requests and scores them in batches.
+
+    A background thread flushes pending evaluations every `batch_size` items or
+    `flush_interval` seconds (whichever comes first) with a single
+    `RAGASEvaluator.evaluate_batch` call, then writes each result back to its
+    log file. Call flush() before exiting (LLMProvider.flush() does): the exit
+    fallback in llms.base closes the queue only after pending log jobs are
+    drained, but RAGAS's thread pools are already shut down by then.
+    """
+
+    def __init__(self, batch_size: int = 8, flush_interval: float = 5.0):
+        """
+        Initialize queue and start the worker thread.
+
+        Args:
+            batch_size: Flush as soon as this many evaluations are pending (default: 8)
+            flush_interval: Max seconds an evaluation waits for a batch (default: 5.0)
+        """
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: queue.Queue = queue.Queue()
+        self._closed = False
+
+        self._worker = threading.Thread(target=self._run, name="llm-eval", daemon=True)
+        self._worker.start()
+
+    def submit(
+        self,
+        log_file: Path,
+        execution_logger: Any,
+        prompt: str,
+        response: str,
+        context: str | None = None,
+        ground_truth: str | None = None,
+        fast_mode: bool = False
+    ):
+        """
+        Queue a response for evaluation.
+
+        Args:
+            log_file: Log file the evaluation metrics will be added to
+            execution_logger: ExecutionLogger that owns log_file
+            prompt: User prompt
+            response: LLM response
+            context: Optional context for faithfulness evaluation
+            ground_truth: Optional ground truth answer for correctness evaluation
+            fast_mode: Embedding-only relevance triage (see RAGASEvaluator.evaluate_response)
+        """
+        item = {
+            "prompt": prompt,
+            "response": response,
+            "context": context,
+            "ground_truth": ground_truth,
+            "fast_mode": fast_mode,
+        }
+        self._queue.put((log_file, execution_logger, item))
+
+    def flush(self, timeout: float | None = None):
+        """
+        Evaluate pending items now and block until their results are written.
+
+        Args:
+            timeout: Max seconds to wait (None waits indefinitely)
+        """
+        if self._closed:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait(timeout)
+
+    def close(self):
+        """Flush pending evaluations and stop the worker."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_STOP)
+        self._worker.join()
+
+    def _run(self):
+        """Worker loop: collect items until the batch is full or the interval elapses."""
+        pending = []
+        deadline = 0.0
+
+        while True:
+            timeout = max(0.0, deadline - time.monotonic()) if pending else None
+            try:
+                entry = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                entry = None  # Flush interval elapsed
+
+            if entry is _STOP:
+                self._flush(pending)
+                return
+
+            if isinstance(entry, threading.Event):  # flush() request
+                self._flush(pending)
+                pending = []
+                entry.set()
+                continue
+
+            if entry is not None:
+                if not pending:
+                    deadline = time.monotonic() + self.flush_interval
+                pending.append(entry)
+                if len(pending) < self.batch_size:
+                    continue
+
+            self._flush(pending)
+            pending = []
 
+    def _flush(self, pending: list[tuple[Path, Any, dict[str, Any]]]):
+        """Evaluate pending items in one batch and write results to their log files."""
+        if not pending:
+            return
+
+        try:
+            results = _get_evaluator().evaluate_batch([item for _, _, item in pending])
         except Exception as e:
-            logger.error(f"❌ RAGAS evaluation failed: {e}")
-            return {
-                "relevance": None,
-                "coherence": None,
-                "correctness": None,
-                "context_quality": None,
-                "overall_score": None,
-                "error": str(e),
-                "metrics_used": [],
-            }
+            logger.warning(f"⚠️ Could not initialize evaluator: {e}")
+            results = [_error_result(f"Evaluator initialization failed: {str(e)}") for _ in pending]
+
+        # Map results back to their log files by row index
+        for (log_file, execution_logger, _), result in zip(pending, results):
+            try:
+                execution_logger.add_evaluation_metrics(log_file, result)
+            except Exception as e:
+                logger.warning(f"⚠️ Evaluation failed: {e}")
+
+
+@functools.lru_cache(maxsize=1)
+def _build_evaluator() -> RAGASEvaluator:
+    """Build the process-wide RAGASEvaluator (memoized)."""
+    return RAGASEvaluator()
+
+
+def _get_evaluator() -> RAGASEvaluator:
+    """Return the process-wide RAGASEvaluator, building it on first use."""
+    with _EVALUATOR_LOCK:
+        return _build_evaluator()
+
+
+def get_evaluation_queue(batch_size: int = 8, flush_interval: float = 5.0) -> EvaluationQueue:
+    """
+    Return the process-wide EvaluationQueue, building it on first use.
+
+    Args:
+        batch_size: Batch size used if the queue is created by this call
+        flush_interval: Flush interval used if the queue is created by this call
+
+    Returns:
+        Shared EvaluationQueue instance
+    """
+    global _EVALUATION_QUEUE
+
+    if _EVALUATION_QUEUE is None:
+        with _EVALUATION_QUEUE_LOCK:
+            if _EVALUATION_QUEUE is None:
+                _EVALUATION_QUEUE = EvaluationQueue(batch_size, flush_interval)
+    return _EVALUATION_QUEUE
+
+
+def close_evaluation_queue():
+    """Flush pending evaluations and stop the shared queue's worker (no-op if none was created)."""
+    if _EVALUATION_QUEUE is not None:
+        _EVALUATION_QUEUE.close()
+
+
+def flush_evaluations(timeout: float | None = None):
+    """
+    Block until queued evaluations are scored and written (no-op if none were queued).
+
+    Args:
+        timeout: Max seconds to wait (None waits indefinitely)
+    """
+    if _EVALUATION_QUEUE is not None:
+        _EVALUATION_QUEUE.flush(timeout)
 
 
 def evaluate_response(
     prompt: str,
     response: str,
     context: str | None = None,
-    ground_truth: str | None = None
+    ground_truth: str | None = None,
+    fast_mode: bool = False
 ) -> dict[str, Any]:
     """
     Convenience function to evaluate a response.
 
+    The underlying RAGASEvaluator is built once per process and reused.
+
     Args:
         prompt: User prompt
         response: LLM response
         context: Optional context for faithfulness evaluation
         ground_truth: Optional ground truth answer for correctness evaluation
+        fast_mode: Embedding-only relevance triage (see RAGASEvaluator.evaluate_response)
 
     Returns:
         Evaluation results dict
     """
     try:
-        evaluator = RAGASEvaluator()
-        return evaluator.evaluate_response(prompt, response, context, ground_truth)
+        return _get_evaluator().evaluate_response(prompt, response, context, ground_truth, fast_mode)
     except Exception as e:
         logger.warning(f"⚠️ Could not initialize evaluator: {e}")
-        return {
-            "relevance": None,
-            "coherence": None,
-            "correctness": None,
-            "context_quality": None,
-            "overall_score": None,
-            "error": f"Evaluator initialization failed: {str(e)}",
-            "metrics_used": [],
-        }
+        return _error_result(f"Evaluator initialization failed: {str(e)}")
+
+
+def evaluate_responses(items: list[dict[str, Any]], fast_mode: bool = False) -> list[dict[str, Any]]:
+    """
+    Convenience function to evaluate several responses in batch.
+
+    Args:
+        items: List of dicts with keys "question", "answer" and optional
+            "context", "ground_truth" and "fast_mode" (overrides fast_mode)
+        fast_mode: Embedding-only relevance triage for every item
+
+    Returns:
+        List of evaluation results dicts, in the same order as items
+    """
+    try:
+        return _get_evaluator().evaluate_responses(items, fast_mode)
+    except Exception as e:
+        logger.warning(f"⚠️ Could not initialize evaluator: {e}")
+        return [_error_result(f"Evaluator initialization failed: {str(e)}") for _ in items]
+
+
+async def evaluate_response_async(
+    prompt: str,
+    response: str,
+    context: str | None = None,
+    ground_truth: str | None = None,
+    fast_mode: bool = False
+) -> dict[str, Any]:
+    """
+    Async convenience function to evaluate a response (see evaluate_response).
+
+    Returns:
+        Evaluation results dict
+    """
+    return await asyncio.to_thread(evaluate_response, prompt, response, context, ground_truth, fast_mode)
+
+
+async def evaluate_responses_async(
+    items: list[dict[str, Any]],
+    fast_mode: bool = False
+) -> list[dict[str, Any]]:
+    """
+    Async convenience function to evaluate several responses in batch (see evaluate_responses).
+
+    Returns:
+        List of evaluation results dicts, in the same order as items
+    """
+    return await asyncio.to_thread(evaluate_responses, items, fast_mode)
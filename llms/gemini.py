@@ -3,12 +3,17 @@ Google Gemini LLM provider.
 Supports Gemini Pro, Gemini Ultra, and other Gemini models.
 """
 
+from collections import OrderedDict
 from typing import Any
 from loguru import logger
 
 from .base import LLMProvider
 
 
+# Max distinct texts remembered by the count_tokens() fallback
+_TOKEN_CACHE_SIZE = 512
+
+
 class GeminiProvider(LLMProvider):
     """Google Gemini LLM provider."""
 
@@ -44,10 +49,16 @@ class GeminiProvider(LLMProvider):
                 temperature=self.temperature,
                 max_output_tokens=self.max_tokens,
             )
+            self._default_key = (self.temperature, self.max_tokens)
+            self._cfg_cache = {self._default_key: self.generation_config}
 
             # Store last prompt and response for token counting
             self.last_prompt = None
             self.last_response = None
+            self.last_usage_metadata = None
+
+            # text -> count_tokens() result, LRU-evicted (see _count_tokens)
+            self._tok_cache: OrderedDict[str, int] = OrderedDict()
 
             logger.success(f"✅ Gemini LLM initialized: {self.model_name}")
             
@@ -66,13 +77,7 @@ class GeminiProvider(LLMProvider):
     ) -> str:
         """Generate response using Gemini."""
         try:
-            # Update generation config if overrides provided
-            gen_config = self.generation_config
-            if temperature is not None or max_tokens is not None:
-                gen_config = self.genai.types.GenerationConfig(
-                    temperature=temperature or self.temperature,
-                    max_output_tokens=max_tokens or self.max_tokens,
-                )
+            gen_config = self._generation_config(temperature, max_tokens)
 
             # Combine system prompt with user prompt if provided
             full_prompt = prompt
@@ -87,6 +92,7 @@ class GeminiProvider(LLMProvider):
             # Store for token counting
             self.last_prompt = full_prompt
             self.last_response = response.text
+            self.last_usage_metadata = getattr(response, "usage_metadata", None)
 
             return response.text
 
@@ -94,6 +100,24 @@ class GeminiProvider(LLMProvider):
             logger.error(f"❌ Gemini generation failed: {e}")
             raise
 
+    def _generation_config(self, temperature: float | None, max_tokens: int | None):
+        """Return the GenerationConfig for these overrides, built once per distinct pair."""
+        key = (
+            self.temperature if temperature is None else temperature,
+            self.max_tokens if max_tokens is None else max_tokens,
+        )
+        if key == self._default_key:
+            return self.generation_config
+
+        gen_config = self._cfg_cache.get(key)
+        if gen_config is None:
+            gen_config = self.genai.types.GenerationConfig(
+                temperature=key[0],
+                max_output_tokens=key[1],
+            )
+            self._cfg_cache[key] = gen_config
+        return gen_config
+
     def get_metadata(self) -> dict[str, Any]:
         """Return provider metadata."""
         return {
@@ -106,17 +130,28 @@ class GeminiProvider(LLMProvider):
         }
 
     def get_usage_info(self) -> dict[str, int]:
-        """Extract token usage using Gemini's count_tokens() method."""
+        """
+        Extract token usage from the last response's usage_metadata.
+
+        Falls back to Gemini's count_tokens() (two extra API calls) only when
+        the response carried no usage metadata.
+        """
+        usage = self.last_usage_metadata
+        if usage is not None and getattr(usage, "prompt_token_count", None) is not None:
+            input_tokens = usage.prompt_token_count
+            output_tokens = getattr(usage, "candidates_token_count", None) or 0
+            total_tokens = getattr(usage, "total_token_count", None) or input_tokens + output_tokens
+            return {
+                "input_tokens": input_tokens,
+                "output_tokens": output_tokens,
+                "total_tokens": total_tokens
+            }
+
         if hasattr(self, 'last_prompt') and hasattr(self, 'last_response'):
             if self.last_prompt and self.last_response:
                 try:
-                    # Count input tokens
-                    input_count = self.model.count_tokens(self.last_prompt)
-                    input_tokens = input_count.total_tokens
-
-                    # Count output tokens
-                    output_count = self.model.count_tokens(self.last_response)
-                    output_tokens = output_count.total_tokens
+                    input_tokens = self._count_tokens(self.last_prompt)
+                    output_tokens = self._count_tokens(self.last_response)
 
                     return {
                         "input_tokens": input_tokens,
@@ -137,3 +172,15 @@ class GeminiProvider(LLMProvider):
             "total_tokens": input_tokens + output_tokens
         }
 
+    def _count_tokens(self, text: str) -> int:
+        """Count tokens with Gemini's count_tokens(), memoized per text (LRU)."""
+        count = self._tok_cache.get(text)
+        if count is not None:
+            self._tok_cache.move_to_end(text)
+            return count
+
+        count = self.model.count_tokens(text).total_tokens
+        self._tok_cache[text] = count
+        if len(self._tok_cache) > _TOKEN_CACHE_SIZE:
+            self._tok_cache.popitem(last=False)
+        return count
@@ -0,0 +1,90 @@
+"""
+Shared httpx client factories for OpenAI-compatible SDK clients.
+
+Clients are created with HTTP/2 when the `h2` package is installed, so
+concurrent completions are multiplexed over a single TLS connection, and fall
+back to HTTP/1.1 keep-alive otherwise.
+
+The OpenAI SDK uses the timeout of an explicit http_client instead of its own
+default, so the defaults below match the SDK's (600 s, 5 s to connect): long
+reasoning runs and large completions must not be cut off and retried.
+"""
+
+import httpx
+from loguru import logger
+
+try:
+    import h2  # noqa: F401 - only needed by httpx for HTTP/2
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# Same as openai.DEFAULT_TIMEOUT
+DEFAULT_TIMEOUT = 600.0
+DEFAULT_CONNECT_TIMEOUT = 5.0
+
+
+def _client_options(
+    max_connections: int,
+    max_keepalive_connections: int,
+    timeout: float,
+    connect_timeout: float,
+) -> dict:
+    """Keyword arguments shared by the sync and async clients."""
+    if not HTTP2_AVAILABLE:
+        logger.debug("h2 not installed, using HTTP/1.1 keep-alive (pip install 'httpx[http2]')")
+
+    return {
+        "http2": HTTP2_AVAILABLE,
+        "timeout": httpx.Timeout(timeout, connect=connect_timeout),
+        "limits": httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+        ),
+    }
+
+
+def build_http_client(
+    max_connections: int = 64,
+    max_keepalive_connections: int = 64,
+    timeout: float = DEFAULT_TIMEOUT,
+    connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+) -> httpx.Client:
+    """
+    Build an httpx client with connection pooling (and HTTP/2 if available).
+
+    Args:
+        max_connections: Maximum concurrent connections (default: 64)
+        max_keepalive_connections: Idle connections kept open (default: 64)
+        timeout: Request timeout in seconds (default: 600.0, as the OpenAI SDK)
+        connect_timeout: Connection timeout in seconds (default: 5.0)
+
+    Returns:
+        httpx.Client instance
+    """
+    return httpx.Client(
+        **_client_options(max_connections, max_keepalive_connections, timeout, connect_timeout)
+    )
+
+
+def build_async_http_client(
+    max_connections: int = 64,
+    max_keepalive_connections: int = 64,
+    timeout: float = DEFAULT_TIMEOUT,
+    connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+) -> httpx.AsyncClient:
+    """
+    Async counterpart of build_http_client (for SDK clients' async calls).
+
+    Args:
+        max_connections: Maximum concurrent connections (default: 64)
+        max_keepalive_connections: Idle connections kept open (default: 64)
+        timeout: Request timeout in seconds (default: 600.0, as the OpenAI SDK)
+        connect_timeout: Connection timeout in seconds (default: 5.0)
+
+    Returns:
+        httpx.AsyncClient instance
+    """
+    return httpx.AsyncClient(
+        **_client_options(max_connections, max_keepalive_connections, timeout, connect_timeout)
+    )
@@ -5,15 +5,21 @@ Uses HuggingFace Router with OpenAI-compatible API.
 
 from typing import Any
 import os
+import threading
 from openai import OpenAI
 from loguru import logger
 
 from .base import LLMProvider
+from .http_client import build_http_client
 
 
 class HuggingFaceProvider(LLMProvider):
     """HuggingFace LLM provider using Router API."""
 
+    # (base_url, api_key) -> OpenAI client, shared so new providers reuse open connections
+    _client_cache: dict[tuple[str, str], OpenAI] = {}
+    _client_cache_lock = threading.Lock()
+
     def __init__(self, config: dict[str, Any]):
         """
         Initialize HuggingFace provider.
@@ -40,11 +46,8 @@ class HuggingFaceProvider(LLMProvider):
         # Get base URL (allow custom endpoints)
         base_url = config.get("base_url", "https://router.huggingface.co/v1")
         
-        # Initialize OpenAI client with HuggingFace endpoint
-        self.client = OpenAI(
-            base_url=base_url,
-            api_key=api_key,
-        )
+        # OpenAI client with HuggingFace endpoint (shared per base_url/api_key)
+        self.client = self._get_client(base_url, api_key)
         
         self.model_name = config.get("model_name")
         if not self.model_name:
@@ -52,9 +55,29 @@ class HuggingFaceProvider(LLMProvider):
 
         self.last_response = None  # Store last response for token extraction
         self.last_prompt = None  # Store prompt for fallback estimation
+        self._system_msg = None  # Last system message dict, reused while the prompt is unchanged
 
         logger.success(f"✅ HuggingFace LLM initialized: {self.model_name}")
 
+    @classmethod
+    def _get_client(cls, base_url: str, api_key: str) -> OpenAI:
+        """Return the shared OpenAI client for this endpoint, creating it on first use."""
+        key = (base_url, api_key)
+        client = cls._client_cache.get(key)
+        if client is not None:
+            return client
+
+        with cls._client_cache_lock:
+            client = cls._client_cache.get(key)
+            if client is None:
+                client = OpenAI(
+                    base_url=base_url,
+                    api_key=api_key,
+                    http_client=build_http_client(),
+                )
+                cls._client_cache[key] = client
+        return client
+
     def generate(
         self,
         prompt: str,
@@ -64,18 +87,20 @@ class HuggingFaceProvider(LLMProvider):
     ) -> str:
         """Generate response using HuggingFace."""
         try:
-            messages = []
-
+            user_msg = {"role": "user", "content": prompt}
             if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-
-            messages.append({"role": "user", "content": prompt})
+                system_msg = self._system_msg
+                if system_msg is None or system_msg["content"] != system_prompt:
+                    system_msg = self._system_msg = {"role": "system", "content": system_prompt}
+                messages = [system_msg, user_msg]
+            else:
+                messages = [user_msg]
 
             response = self.client.chat.completions.create(
                 model=self.model_name,
                 messages=messages,
-                temperature=temperature or self.temperature,
-                max_tokens=max_tokens or self.max_tokens,
+                temperature=self.temperature if temperature is None else temperature,
+                max_tokens=self.max_tokens if max_tokens is None else max_tokens,
             )
 
             # Store for token extraction
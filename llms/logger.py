@@ -4,13 +4,61 @@ Execution logging system for LLM runs.
 Automatically logs prompts, responses, tokens, costs, and latency to JSON files.
 """
 
+import asyncio
+import atexit
 import json
+import os
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 from loguru import logger
 
+# orjson (optional) parses/serializes several times faster and works on bytes directly
+# (orjson.JSONDecodeError subclasses json.JSONDecodeError)
+try:
+    import orjson
+    from orjson import loads as _loads
+
+    def _dumps(data: dict[str, Any]) -> bytes:
+        """Serialize data to pretty-printed UTF-8 JSON bytes."""
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+
+except ImportError:
+    from json import loads as _loads
+
+    def _dumps(data: dict[str, Any]) -> bytes:
+        """Serialize data to pretty-printed UTF-8 JSON bytes."""
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+# Model name -> filename slug: drop dots, dash-separate ':', '/' and spaces
+_SLUG_TABLE = str.maketrans({'.': '', ':': '-', '/': '-', ' ': '-'})
+
+# Running totals file kept next to the logs (see get_log_stats)
+INDEX_FILENAME = "_index.json"
+
+# Serializes index read-modify-write across loggers/threads of this process
+_INDEX_LOCK = threading.Lock()
+
+
+def _write_json(path: Path, data: dict[str, Any], exclusive: bool = False):
+    """
+    Serialize data to pretty JSON in memory and write it with a single write() call.
+
+    Args:
+        path: Destination file
+        data: JSON-serializable dict
+        exclusive: Create the file with O_EXCL, failing if it already exists
+
+    Raises:
+        FileExistsError: If exclusive is set and the file already exists
+    """
+    payload = _dumps(data)
+    with open(path, 'xb' if exclusive else 'wb') as f:
+        f.write(payload)
+
 
 class ExecutionLogger:
     """Manages logging of LLM executions to JSON files."""
@@ -23,6 +71,7 @@ class ExecutionLogger:
             log_dir: Directory to store log files (default: "logs")
         """
         self.log_dir = Path(log_dir)
+        self._stats_path = self.log_dir / INDEX_FILENAME
         self._ensure_log_directory()
 
     def _ensure_log_directory(self):
@@ -32,39 +81,29 @@ class ExecutionLogger:
         except Exception as e:
             logger.warning(f"Failed to create log directory {self.log_dir}: {e}")
 
-    def _generate_filename(self, model: str, timestamp: datetime) -> str:
+    def _generate_filename(self, model: str, timestamp: datetime, with_micro: bool = False) -> str:
         """
         Generate log filename in format: {model_slug}-{timestamp}.json
 
         Args:
             model: Model name
             timestamp: Datetime object
+            with_micro: Append microseconds (used to resolve collisions)
 
         Returns:
             Filename string
         """
         # Clean model name to create slug
-        model_slug = (
-            model
-            .replace('.', '')
-            .replace(':', '-')
-            .replace('/', '-')
-            .replace(' ', '-')
-            .lower()
-        )
+        model_slug = model.translate(_SLUG_TABLE).lower()
 
-        # Format timestamp: YYYY-MM-DD-HHMMSS
-        time_str = timestamp.strftime("%Y-%m-%d-%H%M%S")
+        # Format timestamp: YYYY-MM-DD-HHMMSS (from the fields, no strftime format parsing)
+        t = timestamp
+        time_str = f"{t.year:04d}-{t.month:02d}-{t.day:02d}-{t.hour:02d}{t.minute:02d}{t.second:02d}"
 
-        filename = f"{model_slug}-{time_str}.json"
+        if with_micro:
+            return f"{model_slug}-{time_str}-{t.microsecond:06d}.json"
 
-        # Handle potential collisions by adding microseconds
-        log_file = self.log_dir / filename
-        if log_file.exists():
-            micro_str = timestamp.strftime("%f")
-            filename = f"{model_slug}-{time_str}-{micro_str}.json"
-
-        return filename
+        return f"{model_slug}-{time_str}.json"
 
     def log_execution(
         self,
@@ -73,7 +112,10 @@ class ExecutionLogger:
         metadata: dict[str, Any],
         tokens: dict[str, int],
         cost: dict[str, Any],
-        latency: float
+        latency: float,
+        first_token_ms: float | None = None,
+        cache_hit: bool = False,
+        cached_usage: dict[str, int] | None = None
     ) -> Path | None:
         """
         Log LLM execution to JSON file.
@@ -85,6 +127,10 @@ class ExecutionLogger:
             tokens: Token usage dict (input, output, total)
             cost: Cost breakdown dict
             latency: Execution time in milliseconds
+            first_token_ms: Time to first streamed chunk in milliseconds (None if not streamed)
+            cache_hit: Whether the response was served from a cache
+            cached_usage: Token usage of the original generation, for cache hits
+                (tokens/cost are zero then: no API call was made)
 
         Returns:
             Path to created log file, or None if logging failed
@@ -103,6 +149,9 @@ class ExecutionLogger:
                 "tokens": tokens,
                 "cost": cost,
                 "latency_ms": round(latency, 2),
+                "first_token_ms": round(first_token_ms, 2) if first_token_ms is not None else None,
+                "cache_hit": cache_hit,
+                **({"cached_usage": cached_usage} if cached_usage is not None else {}),
                 "metadata": {
                     "temperature": metadata.get("temperature"),
                     "max_tokens": metadata.get("max_tokens"),
@@ -111,17 +160,42 @@ class ExecutionLogger:
                 }
             }
 
-            # Write JSON with pretty formatting
-            with open(log_file, 'w', encoding='utf-8') as f:
-                json.dump(log_data, f, indent=2, ensure_ascii=False)
-
-            logger.success(f"💾 Logged to: {log_file}")
-            return log_file
+            return self._write_log(log_file, log_data, metadata["model"], timestamp)
 
         except Exception as e:
             logger.error(f"❌ Logging failed: {e}")
             return None
 
+    def _write_log(self, log_file: Path, log_data: dict[str, Any], model: str, timestamp: datetime) -> Path:
+        """
+        Write one log entry and add it to the stats index.
+
+        Args:
+            log_file: Preferred log file path
+            log_data: Log entry
+            model: Model name (to build the collision filename)
+            timestamp: Log timestamp (to build the collision filename)
+
+        Returns:
+            Path of the written log file
+        """
+        # Write JSON with pretty formatting; exclusive create instead of an exists() check,
+        # collisions (same model, same second) get a microseconds suffix
+        try:
+            _write_json(log_file, log_data, exclusive=True)
+        except FileExistsError:
+            log_file = self.log_dir / self._generate_filename(model, timestamp, with_micro=True)
+            _write_json(log_file, log_data, exclusive=True)
+
+        logger.success(f"💾 Logged to: {log_file}")
+
+        try:
+            self._update_index([log_data])
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to update log index {self._stats_path}: {e}")
+
+        return log_file
+
     def add_evaluation_metrics(self, log_file: Path, eval_results: dict[str, Any]):
         """
         Add evaluation metrics to existing log file.
@@ -136,15 +210,13 @@ class ExecutionLogger:
         """
         try:
             # Read existing log
-            with open(log_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            data = _loads(log_file.read_bytes())
 
             # Add evaluation section
             data["evaluation"] = eval_results
 
             # Write updated data
-            with open(log_file, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            _write_json(log_file, data)
 
             logger.success(f"📊 Added evaluation metrics to: {log_file}")
 
@@ -158,36 +230,89 @@ class ExecutionLogger:
             logger.error(f"❌ Failed to add evaluation metrics: {e}")
             raise
 
+    def _scan_logs(self) -> dict[str, Any]:
+        """
+        Compute running totals by reading every log file (slow path).
+
+        Returns:
+            Index dict with total_logs, total_cost, total_tokens and providers
+        """
+        total_logs = 0
+        total_cost = 0.0
+        total_tokens = 0
+        providers = set()
+
+        for log_file in self.log_dir.glob("*.json"):
+            if log_file.name == INDEX_FILENAME:
+                continue
+            total_logs += 1
+            try:
+                data = _loads(log_file.read_bytes())
+                tokens = data.get("tokens", {})
+                total_cost += data.get("cost", {}).get("total_cost", 0)
+                total_tokens += tokens.get("total_tokens", tokens.get("total", 0))
+                providers.add(data.get("provider", "unknown"))
+            except Exception:
+                continue
+
+        return {
+            "total_logs": total_logs,
+            "total_cost": total_cost,
+            "total_tokens": total_tokens,
+            "providers": sorted(providers),
+        }
+
+    def _update_index(self, entries: list[dict[str, Any]]):
+        """
+        Add logged executions to the running totals in _index.json.
+
+        The index is rewritten atomically (temp file + os.replace). If it doesn't
+        exist yet (first run or older log directories) it is seeded with a full
+        scan, which already includes the logs just written.
+
+        Args:
+            entries: The log entries just written
+        """
+        with _INDEX_LOCK:
+            try:
+                index = _loads(self._stats_path.read_bytes())
+            except FileNotFoundError:
+                index = self._scan_logs()
+            else:
+                providers = set(index["providers"])
+                for log_data in entries:
+                    tokens = log_data.get("tokens") or {}
+                    index["total_logs"] += 1
+                    index["total_cost"] += (log_data.get("cost") or {}).get("total_cost", 0)
+                    index["total_tokens"] += tokens.get("total_tokens", 0)
+                    providers.add(log_data.get("provider", "unknown"))
+                index["providers"] = sorted(providers)
+
+            tmp_path = self._stats_path.with_name(f"{INDEX_FILENAME}.{os.getpid()}.tmp")
+            _write_json(tmp_path, index)
+            os.replace(tmp_path, self._stats_path)
+
     def get_log_stats(self) -> dict[str, Any]:
         """
         Get statistics about logged executions.
 
+        Reads the running totals from _index.json, falling back to scanning
+        every log file when the index doesn't exist yet.
+
         Returns:
             Dict with stats (total logs, total cost, etc.)
         """
         try:
-            log_files = list(self.log_dir.glob("*.json"))
-            total_logs = len(log_files)
-
-            total_cost = 0.0
-            total_tokens = 0
-            providers = set()
-
-            for log_file in log_files:
-                try:
-                    with open(log_file, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                        total_cost += data.get("cost", {}).get("total_cost", 0)
-                        total_tokens += data.get("tokens", {}).get("total", 0)
-                        providers.add(data.get("provider", "unknown"))
-                except Exception:
-                    continue
+            try:
+                index = _loads(self._stats_path.read_bytes())
+            except FileNotFoundError:
+                index = self._scan_logs()
 
             return {
-                "total_logs": total_logs,
-                "total_cost": round(total_cost, 4),
-                "total_tokens": total_tokens,
-                "providers_used": sorted(list(providers)),
+                "total_logs": index["total_logs"],
+                "total_cost": round(index["total_cost"], 4),
+                "total_tokens": index["total_tokens"],
+                "providers_used": index["providers"],  # already sorted by _scan_logs/_update_index
                 "log_directory": str(self.log_dir)
             }
 
@@ -201,3 +326,138 @@ class ExecutionLogger:
                 "log_directory": str(self.log_dir),
                 "error": str(e)
             }
+
+
+class AsyncExecutionLogger(ExecutionLogger):
+    """
+    ExecutionLogger that batches log writes on a background event loop.
+
+    log_execution() only serializes the entry and enqueues it; a drain task on
+    the logger's own thread writes up to batch_size pending files at a time and
+    updates the stats index once per batch. Intended for high-volume runs (eval sweeps).
+    Call flush() to wait for pending writes (also done at interpreter exit).
+    """
+
+    def __init__(self, log_dir: str = "logs", batch_size: int = 16):
+        """
+        Initialize async logger.
+
+        Args:
+            log_dir: Directory to store log files (default: "logs")
+            batch_size: Max log files written per batch (default: 16)
+        """
+        super().__init__(log_dir)
+        self.batch_size = batch_size
+        self._pending: set[Path] = set()
+        self._pending_lock = threading.Lock()
+        self._closed = False
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="async-log", daemon=True)
+        self._thread.start()
+        asyncio.run_coroutine_threadsafe(self._start(), self._loop).result()
+        atexit.register(self.close)
+
+    async def _start(self):
+        """Create the queue and the drain task inside the logger's event loop."""
+        self._queue = asyncio.Queue()
+        self._drain_task = asyncio.create_task(self._drain())
+
+    async def _stop(self):
+        """Cancel the drain task and wait for it to finish."""
+        self._drain_task.cancel()
+        try:
+            await self._drain_task
+        except asyncio.CancelledError:
+            pass
+
+    def _write_log(self, log_file: Path, log_data: dict[str, Any], model: str, timestamp: datetime) -> Path:
+        """
+        Enqueue one log entry for the background writer.
+
+        The file doesn't exist yet when this returns, so the name always carries
+        the microseconds suffix instead of relying on the exclusive-create retry.
+
+        Returns:
+            Path the log file will be written to
+        """
+        # After close() (e.g. logs submitted during interpreter exit) write synchronously
+        if self._closed:
+            return super()._write_log(log_file, log_data, model, timestamp)
+
+        base = self.log_dir / self._generate_filename(model, timestamp, with_micro=True)
+        log_file = base
+        with self._pending_lock:
+            # Entries logged within the same microsecond get a counter suffix
+            counter = 1
+            while log_file in self._pending:
+                log_file = base.with_name(f"{base.stem}-{counter}{base.suffix}")
+                counter += 1
+            self._pending.add(log_file)
+        self._loop.call_soon_threadsafe(self._queue.put_nowait, (log_file, log_data))
+        return log_file
+
+    async def _drain(self):
+        """Write queued entries in batches until the logger is closed."""
+        while True:
+            batch = [await self._queue.get()]
+            while len(batch) < self.batch_size and not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+
+            # Written on the logger's own thread (joined in close()): the default
+            # executor used by asyncio.to_thread is already shut down at interpreter exit
+            try:
+                self._write_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write_batch(self, batch: list[tuple[Path, dict[str, Any]]]):
+        """Write a batch of log files and add them to the stats index (logger thread)."""
+        written = []
+        for log_file, log_data in batch:
+            try:
+                _write_json(log_file, log_data, exclusive=True)
+                written.append(log_data)
+            except Exception as e:
+                logger.error(f"❌ Logging failed for {log_file}: {e}")
+            finally:
+                with self._pending_lock:
+                    self._pending.discard(log_file)
+
+        if written:
+            logger.success(f"💾 Logged {len(written)} executions to: {self.log_dir}")
+            try:
+                self._update_index(written)
+            except Exception as e:
+                logger.warning(f"⚠️ Failed to update log index {self._stats_path}: {e}")
+
+    def flush(self, timeout: float | None = None):
+        """
+        Block until every enqueued log entry has been written.
+
+        Args:
+            timeout: Max seconds to wait (None waits indefinitely)
+        """
+        if not self._loop.is_running():
+            return
+        asyncio.run_coroutine_threadsafe(self._queue.join(), self._loop).result(timeout)
+
+    def close(self):
+        """Flush pending writes and stop the background event loop."""
+        if self._closed or not self._loop.is_running():
+            return
+        self._closed = True
+        self.flush()
+        asyncio.run_coroutine_threadsafe(self._stop(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def add_evaluation_metrics(self, log_file: Path, eval_results: dict[str, Any]):
+        """Add evaluation metrics, waiting for the log file first if it is still queued."""
+        with self._pending_lock:
+            pending = log_file in self._pending
+        if pending:
+            self.flush()
+        super().add_evaluation_metrics(log_file, eval_results)
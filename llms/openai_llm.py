@@ -3,11 +3,20 @@ OpenAI LLM provider.
 Supports GPT-4, GPT-4 Turbo, and GPT-3.5 models.
 """
 
+import atexit
 from typing import Any
 from openai import OpenAI
 from loguru import logger
 
 from .base import LLMProvider
+from .http_client import build_http_client
+
+# One connection pool shared by every OpenAI provider instance in the process
+_SHARED_HTTP = build_http_client(max_connections=40, max_keepalive_connections=20)
+atexit.register(_SHARED_HTTP.close)
+
+# Usage reported when no response is available
+_ZERO_USAGE = {"input_tokens": 0, "output_tokens": 0, "total_tokens": 0}
 
 
 class OpenAILLMProvider(LLMProvider):
@@ -30,7 +39,7 @@ class OpenAILLMProvider(LLMProvider):
         if not api_key:
             raise ValueError("OpenAI API key is required in config")
 
-        self.client = OpenAI(api_key=api_key)
+        self.client = OpenAI(api_key=api_key, http_client=_SHARED_HTTP)
         self.model_name = config.get("model_name", "gpt-4-turbo")
         self.last_response = None  # Store last response for token extraction
 
@@ -45,18 +54,17 @@ class OpenAILLMProvider(LLMProvider):
     ) -> str:
         """Generate response using OpenAI."""
         try:
-            messages = []
-
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-
-            messages.append({"role": "user", "content": prompt})
+            messages = (
+                [{"role": "system", "content": system_prompt}, {"role": "user", "content": prompt}]
+                if system_prompt
+                else [{"role": "user", "content": prompt}]
+            )
 
             response = self.client.chat.completions.create(
                 model=self.model_name,
                 messages=messages,
-                temperature=temperature or self.temperature,
-                max_tokens=max_tokens or self.max_tokens,
+                temperature=self.temperature if temperature is None else temperature,
+                max_tokens=self.max_tokens if max_tokens is None else max_tokens,
             )
 
             # Store response for token extraction
@@ -81,19 +89,16 @@ class OpenAILLMProvider(LLMProvider):
 
     def get_usage_info(self) -> dict[str, int]:
         """Extract token usage from last OpenAI response."""
-        if hasattr(self, 'last_response') and self.last_response:
-            usage = self.last_response.usage
-            return {
-                "input_tokens": usage.prompt_tokens,
-                "output_tokens": usage.completion_tokens,
-                "total_tokens": usage.total_tokens
-            }
-
-        # Fallback if no response available
-        logger.warning("⚠️ No response data available for token counting")
+        response = self.last_response
+        if response is None:
+            # Fallback if no response available (copy: callers may annotate usage dicts)
+            logger.warning("⚠️ No response data available for token counting")
+            return dict(_ZERO_USAGE)
+
+        usage = response.usage
         return {
-            "input_tokens": 0,
-            "output_tokens": 0,
-            "total_tokens": 0
+            "input_tokens": usage.prompt_tokens,
+            "output_tokens": usage.completion_tokens,
+            "total_tokens": usage.total_tokens
         }
 
@@ -8,6 +8,7 @@ Pricing sources (as of January 2025):
 - HuggingFace: Usage-based or free tier
 """
 
+from types import MappingProxyType
 from typing import Any
 
 # Pricing in USD per 1 million tokens
@@ -85,69 +86,150 @@ MODEL_PRICING = {
     }
 }
 
-
-class CostCalculator:
-    """Calculate costs for LLM API calls."""
-
-    @staticmethod
-    def calculate_cost(model: str, input_tokens: int, output_tokens: int) -> dict[str, Any]:
-        """
-        Calculate cost based on token usage and model pricing.
-
-        Args:
-            model: Model name
-            input_tokens: Number of input/prompt tokens
-            output_tokens: Number of output/completion tokens
-
-        Returns:
-            Dict with cost breakdown:
-            {
-                "input_cost": float,
-                "output_cost": float,
-                "total_cost": float,
-                "currency": "USD",
-                "pricing_available": bool
-            }
-        """
-        # Get pricing for model, fallback to default if not found
-        pricing_available = model in MODEL_PRICING
-        pricing = MODEL_PRICING.get(model, MODEL_PRICING["default"])
-
-        # Calculate costs (pricing is per 1M tokens)
-        input_cost = (input_tokens / 1_000_000) * pricing["input"]
-        output_cost = (output_tokens / 1_000_000) * pricing["output"]
-        total_cost = input_cost + output_cost
-
-        return {
-            "input_cost": round(input_cost, 6),
-            "output_cost": round(output_cost, 6),
-            "total_cost": round(total_cost, 6),
+# Pricing is reference data: freeze it (read-only views, outer and inner)
+MODEL_PRICING = MappingProxyType({
+    model: MappingProxyType(pricing) for model, pricing in MODEL_PRICING.items()
+})
+
+# Per-token (input, output) prices, precomputed once from MODEL_PRICING
+_PRICING_PER_TOKEN = MappingProxyType({
+    model: (pricing["input"] * 1e-6, pricing["output"] * 1e-6)
+    for model, pricing in MODEL_PRICING.items()
+})
+_DEFAULT_RATES = _PRICING_PER_TOKEN["default"]
+
+# Anthropic prompt caching multipliers (relative to the model's input price)
+CACHE_WRITE_MULTIPLIER = 1.25
+CACHE_READ_MULTIPLIER = 0.10
+
+
+def calculate_cost(
+    model: str,
+    input_tokens: int,
+    output_tokens: int,
+    cache_creation_tokens: int = 0,
+    cache_read_tokens: int = 0
+) -> dict[str, Any]:
+    """
+    Calculate cost based on token usage and model pricing.
+
+    Args:
+        model: Model name
+        input_tokens: Number of input/prompt tokens (excluding cached tokens)
+        output_tokens: Number of output/completion tokens
+        cache_creation_tokens: Input tokens written to the prompt cache
+        cache_read_tokens: Input tokens read from the prompt cache
+
+    Returns:
+        Dict with cost breakdown:
+        {
+            "input_cost": float,
+            "output_cost": float,
+            "cache_cost": float,
+            "total_cost": float,
             "currency": "USD",
-            "pricing_available": pricing_available
+            "pricing_available": bool
         }
+    """
+    return cost_from_rates(
+        get_rates(model),
+        input_tokens,
+        output_tokens,
+        cache_creation_tokens,
+        cache_read_tokens
+    )
+
+
+def get_rates(model: str) -> tuple[float, float, bool]:
+    """
+    Resolve per-token prices for a model (resolve once, reuse for every call).
+
+    Args:
+        model: Model name
+
+    Returns:
+        Tuple (input_price_per_token, output_price_per_token, pricing_available)
+    """
+    # Get pricing for model (single lookup), fallback to default if not found
+    rates = _PRICING_PER_TOKEN.get(model)
+    pricing_available = rates is not None
+    if rates is None:
+        rates = _DEFAULT_RATES
+
+    return (rates[0], rates[1], pricing_available)
+
+
+def cost_from_rates(
+    rates: tuple[float, float, bool],
+    input_tokens: int,
+    output_tokens: int,
+    cache_creation_tokens: int = 0,
+    cache_read_tokens: int = 0
+) -> dict[str, Any]:
+    """
+    Calculate cost from rates previously resolved with get_rates().
+
+    Args:
+        rates: Tuple returned by get_rates()
+        input_tokens: Number of input/prompt tokens (excluding cached tokens)
+        output_tokens: Number of output/completion tokens
+        cache_creation_tokens: Input tokens written to the prompt cache
+        cache_read_tokens: Input tokens read from the prompt cache
+
+    Returns:
+        Dict with cost breakdown (same format as calculate_cost)
+    """
+    input_rate, output_rate, pricing_available = rates
+
+    input_cost = input_tokens * input_rate
+    output_cost = output_tokens * output_rate
+    cache_cost = (
+        cache_creation_tokens * CACHE_WRITE_MULTIPLIER + cache_read_tokens * CACHE_READ_MULTIPLIER
+    ) * input_rate
+    total_cost = input_cost + output_cost + cache_cost
+
+    return {
+        "input_cost": round(input_cost, 6),
+        "output_cost": round(output_cost, 6),
+        "cache_cost": round(cache_cost, 6),
+        "total_cost": round(total_cost, 6),
+        "currency": "USD",
+        "pricing_available": pricing_available
+    }
+
+
+def get_model_pricing(model: str) -> dict[str, float] | None:
+    """
+    Get pricing info for a specific model.
 
-    @staticmethod
-    def get_model_pricing(model: str) -> dict[str, float] | None:
-        """
-        Get pricing info for a specific model.
+    Args:
+        model: Model name
 
-        Args:
-            model: Model name
+    Returns:
+        Dict with input/output pricing or None if not found
+    """
+    pricing = MODEL_PRICING.get(model)
+    return dict(pricing) if pricing is not None else None
 
-        Returns:
-            Dict with input/output pricing or None if not found
-        """
-        return MODEL_PRICING.get(model)
 
-    @staticmethod
-    def format_cost(cost: float) -> str:
-        """
-        Format cost for display.
+def format_cost(cost: float) -> str:
+    """
+    Format cost for display.
 
-        Args:
-            cost: Cost in USD
+    Args:
+        cost: Cost in USD
+
+    Returns:
+        Formatted string (e.g., "$0.0006")
+    """
+    return f"${cost:.6f}".rstrip('0').rstrip('.')
+
+
+class CostCalculator:
+    """Calculate costs for LLM API calls (namespace kept for backwards compatibility)."""
 
-        Returns:
-            Formatted string (e.g., "$0.0006")
-        """
-        return f"${cost:.6f}".rstrip('0').rstrip('.')
+    calculate_cost = staticmethod(calculate_cost)
+    get_rates = staticmethod(get_rates)
+    cost_from_rates = staticmethod(cost_from_rates)
+    get_model_pricing = staticmethod(get_model_pricing)
+    format_cost = staticmethod(format_cost)
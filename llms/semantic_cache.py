@@ -0,0 +1,299 @@
+"""
+Embedding-based semantic cache for LLM responses.
+
+Serves previous responses for prompts that are semantically equivalent to one
+already answered, skipping the API round-trip entirely.
+
+How does it work?
+1. The user prompt is embedded with a sentence-transformers model (loaded once
+   per process). The system prompt is not embedded: it must match exactly.
+2. Embeddings are L2-normalized and stacked into one matrix per bucket, so a
+   lookup is a single `matrix @ query` dot product (cosine similarity).
+3. If the best match is above the threshold, the cached response is returned.
+   On a miss the query embedding is kept, so put() doesn't embed the prompt again.
+4. New entries are persisted every `save_every` inserts, on flush() and at exit,
+   to a single .npz file (matrices + JSON entries, loaded without pickle) that is
+   written to a temp file and swapped in with os.replace.
+
+Buckets are keyed by (model_name, temperature_bucket, max_tokens, system prompt
+hash): a response generated by another model, with very different sampling or
+under a different system prompt is never reused. Embedding the system prompt
+instead would let a long one fill the encoder's input window (256 word pieces
+for all-MiniLM-L6-v2) and make unrelated questions look identical.
+"""
+
+import atexit
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import weakref
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from loguru import logger
+
+# Sentence-transformers models are expensive to load, share them per process
+_ENCODERS: dict[str, Any] = {}
+_ENCODERS_LOCK = threading.Lock()
+
+# Query embeddings of recent misses kept for the following put() (per cache)
+_MISS_VECTORS_SIZE = 256
+
+# Caches with unsaved entries are persisted at exit (weak refs: caches can still be freed)
+_LIVE_CACHES: "weakref.WeakSet[SemanticCache]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_all():
+    """Persist unsaved entries of every live cache."""
+    for cache in list(_LIVE_CACHES):
+        cache.flush()
+
+
+def _get_encoder(model_name: str):
+    """
+    Load (once per process) the sentence-transformers model used for embeddings.
+
+    Args:
+        model_name: sentence-transformers model name
+
+    Returns:
+        SentenceTransformer instance
+
+    Raises:
+        ImportError: If sentence-transformers is not installed
+    """
+    encoder = _ENCODERS.get(model_name)
+    if encoder is not None:
+        return encoder
+
+    with _ENCODERS_LOCK:
+        encoder = _ENCODERS.get(model_name)
+        if encoder is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+            except ImportError:
+                raise ImportError(
+                    "sentence-transformers is required for semantic caching. "
+                    "Install it with: pip install sentence-transformers"
+                )
+            encoder = SentenceTransformer(model_name)
+            _ENCODERS[model_name] = encoder
+            logger.info(f"🧠 Semantic cache encoder loaded: {model_name}")
+
+    return encoder
+
+
+class SemanticCache:
+    """In-memory semantic cache persisted to an .npz file."""
+
+    def __init__(
+        self,
+        cache_dir: str = ".cache",
+        threshold: float = 0.95,
+        embedding_model: str = "all-MiniLM-L6-v2",
+        save_every: int = 32,
+    ):
+        """
+        Initialize semantic cache.
+
+        Args:
+            cache_dir: Directory for the persisted cache file (default: ".cache")
+            threshold: Minimum cosine similarity to consider a hit (default: 0.95)
+            embedding_model: sentence-transformers model used for embeddings
+            save_every: Persist to disk after this many new entries (default: 32)
+        """
+        self.cache_file = Path(cache_dir) / "semantic_cache.npz"
+        self.threshold = threshold
+        self.embedding_model = embedding_model
+        self.save_every = save_every
+
+        # bucket key -> {"matrix": np.ndarray, "entries": list[(response, usage, metadata)]}
+        self._buckets: dict[tuple, dict[str, Any]] = {}
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._unsaved = 0  # Entries added since the last save
+        self._miss_vectors: OrderedDict[str, Any] = OrderedDict()
+        _LIVE_CACHES.add(self)
+
+    @staticmethod
+    def _bucket_key(model: str, temperature: float, max_tokens: int, system_prompt: str | None) -> tuple:
+        """Build the bucket key; temperatures are bucketed to one decimal, system prompts hashed."""
+        system_hash = hashlib.blake2b((system_prompt or "").encode("utf-8"), digest_size=16).hexdigest()
+        return (model, round(float(temperature), 1), max_tokens, system_hash)
+
+    def _embed(self, prompt: str):
+        """Embed the user prompt as an L2-normalized float32 vector."""
+        import numpy as np
+
+        encoder = _get_encoder(self.embedding_model)
+        vector = encoder.encode(prompt, normalize_embeddings=True)
+        return np.asarray(vector, dtype=np.float32)
+
+    def _load(self):
+        """Load persisted buckets from disk (once)."""
+        if self._loaded:
+            return
+        self._loaded = True
+
+        if not self.cache_file.exists():
+            return
+
+        try:
+            import numpy as np
+
+            # allow_pickle=False: a planted cache file can't execute code
+            with np.load(self.cache_file, allow_pickle=False) as data:
+                meta = json.loads(data["meta"].tobytes())
+                self._buckets = {
+                    tuple(bucket["key"]): {
+                        "matrix": data[f"m{i}"],
+                        "entries": [tuple(entry) for entry in bucket["entries"]],
+                    }
+                    for i, bucket in enumerate(meta)
+                }
+            logger.info(f"🗂️ Semantic cache loaded: {self.cache_file}")
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to load semantic cache {self.cache_file}: {e}")
+            self._buckets = {}
+
+    def _remember_miss(self, prompt: str, vector):
+        """Keep the query embedding of a miss for the put() that usually follows."""
+        with self._lock:
+            self._miss_vectors[prompt] = vector
+            if len(self._miss_vectors) > _MISS_VECTORS_SIZE:
+                self._miss_vectors.popitem(last=False)
+
+    def _save(self):
+        """Persist buckets to disk atomically (caller holds the lock)."""
+        try:
+            import numpy as np
+
+            buckets = list(self._buckets.items())
+            meta = [{"key": list(key), "entries": bucket["entries"]} for key, bucket in buckets]
+            arrays = {f"m{i}": bucket["matrix"] for i, (_, bucket) in enumerate(buckets)}
+            arrays["meta"] = np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8)
+
+            # Temp file + os.replace: a crash mid-write never corrupts the cache
+            self.cache_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self.cache_file.parent, prefix=f".{self.cache_file.name}.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    np.savez(f, **arrays)
+                os.replace(tmp_name, self.cache_file)
+            except BaseException:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+                raise
+            self._unsaved = 0
+        except Exception as e:
+            logger.warning(f"⚠️ Failed to persist semantic cache: {e}")
+
+    def flush(self):
+        """Persist entries added since the last save, if any."""
+        with self._lock:
+            if self._unsaved:
+                self._save()
+
+    def lookup(
+        self,
+        prompt: str,
+        system_prompt: str | None,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+    ) -> dict[str, Any] | None:
+        """
+        Find a cached response for a semantically equivalent prompt.
+
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            model: Model name
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens
+
+        Returns:
+            Dict with "response", "usage", "metadata" and "similarity",
+            or None on cache miss
+        """
+        with self._lock:
+            self._load()
+            bucket = self._buckets.get(self._bucket_key(model, temperature, max_tokens, system_prompt))
+
+        if not bucket:
+            return None
+
+        query = self._embed(prompt)
+
+        # Rows and query are normalized, so the dot product is the cosine
+        scores = bucket["matrix"] @ query
+        best = int(scores.argmax())
+        similarity = float(scores[best])
+
+        if similarity < self.threshold:
+            self._remember_miss(prompt, query)
+            return None
+
+        response, usage, metadata = bucket["entries"][best]
+        logger.info(f"⚡ Semantic cache hit (similarity={similarity:.3f})")
+        return {
+            "response": response,
+            "usage": usage,
+            "metadata": metadata,
+            "similarity": similarity,
+        }
+
+    def put(
+        self,
+        prompt: str,
+        system_prompt: str | None,
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        response: str,
+        usage: dict[str, int],
+        metadata: dict[str, Any] | None = None,
+    ):
+        """
+        Store a response in the cache (persisted every `save_every` entries).
+
+        Reuses the query embedding computed by a preceding lookup() miss.
+
+        Args:
+            prompt: User prompt
+            system_prompt: Optional system prompt
+            model: Model name
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens
+            response: Generated response
+            usage: Token usage of the original generation
+            metadata: Optional extra metadata
+        """
+        import numpy as np
+
+        with self._lock:
+            vector = self._miss_vectors.pop(prompt, None)
+        if vector is None:
+            vector = self._embed(prompt)
+        key = self._bucket_key(model, temperature, max_tokens, system_prompt)
+
+        with self._lock:
+            self._load()
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = {"matrix": vector[np.newaxis, :], "entries": []}
+                self._buckets[key] = bucket
+            else:
+                bucket["matrix"] = np.vstack([bucket["matrix"], vector])
+            bucket["entries"].append((response, usage, metadata or {}))
+            self._unsaved += 1
+            if self._unsaved >= self.save_every:
+                self._save()
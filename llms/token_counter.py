@@ -4,8 +4,60 @@ Token counting utilities for LLM providers.
 Provides fallback methods for counting tokens when API doesn't return usage info.
 """
 
+import functools
 from typing import Any
 
+try:
+    import tiktoken
+    _HAS_TIKTOKEN = True
+except ImportError:
+    tiktoken = None
+    _HAS_TIKTOKEN = False
+
+# Texts longer than this skip the estimate_tokens memo
+_ESTIMATE_CACHE_MAX_CHARS = 4096
+
+# tiktoken's encode_batch maps encode over a ThreadPoolExecutor built per call:
+# only worth its startup cost for long conversations
+_ENCODE_BATCH_MIN_FIELDS = 64
+_ENCODE_BATCH_THREADS = 4
+
+# Model name -> tiktoken Encoding (building one parses the whole BPE table)
+_ENCODING_CACHE: dict[str, Any] = {}
+
+
+def _get_encoding(model: str):
+    """
+    Return the (cached) tiktoken encoding for a model.
+
+    Args:
+        model: Model name for encoding selection
+
+    Returns:
+        tiktoken Encoding instance
+
+    Raises:
+        ImportError: If tiktoken is not installed
+    """
+    encoding = _ENCODING_CACHE.get(model)
+    if encoding is not None:
+        return encoding
+
+    if not _HAS_TIKTOKEN:
+        raise ImportError(
+            "tiktoken is required for accurate token counting. "
+            "Install it with: pip install tiktoken"
+        )
+
+    try:
+        encoding = tiktoken.encoding_for_model(model)
+    except KeyError:
+        # Fallback to cl100k_base encoding (used by gpt-4, gpt-3.5-turbo)
+        encoding = tiktoken.get_encoding("cl100k_base")
+
+    _ENCODING_CACHE[model] = encoding
+    return encoding
+
 
 def estimate_tokens(text: str) -> int:
     """
@@ -22,6 +74,15 @@ def estimate_tokens(text: str) -> int:
     """
     if not text:
         return 0
+    # Large texts are cheap to measure and unlikely to repeat: don't cache them
+    if len(text) > _ESTIMATE_CACHE_MAX_CHARS:
+        return len(text) // 4
+    return _estimate_tokens_cached(text)
+
+
+@functools.lru_cache(maxsize=256)
+def _estimate_tokens_cached(text: str) -> int:
+    """Memoized estimate for short texts (e.g. system prompts reused on every call)."""
     return max(1, len(text) // 4)
 
 
@@ -39,21 +100,7 @@ def count_with_tiktoken(text: str, model: str = "gpt-4") -> int:
     Raises:
         ImportError: If tiktoken is not installed
     """
-    try:
-        import tiktoken
-    except ImportError:
-        raise ImportError(
-            "tiktoken is required for accurate token counting. "
-            "Install it with: pip install tiktoken"
-        )
-
-    try:
-        encoding = tiktoken.encoding_for_model(model)
-    except KeyError:
-        # Fallback to cl100k_base encoding (used by gpt-4, gpt-3.5-turbo)
-        encoding = tiktoken.get_encoding("cl100k_base")
-
-    return len(encoding.encode(text))
+    return len(_get_encoding(model).encode(text))
 
 
 def count_messages_tokens(messages: list[dict[str, str]], model: str = "gpt-4") -> dict[str, int]:
@@ -72,26 +119,27 @@ def count_messages_tokens(messages: list[dict[str, str]], model: str = "gpt-4")
         }
     """
     try:
-        import tiktoken
-
-        try:
-            encoding = tiktoken.encoding_for_model(model)
-        except KeyError:
-            encoding = tiktoken.get_encoding("cl100k_base")
+        encoding = _get_encoding(model)
 
         # OpenAI chat format tokens calculation
         # Each message follows: <|start|>{role/name}\n{content}<|end|>\n
         tokens_per_message = 3
         tokens_per_name = 1
 
-        num_tokens = 0
+        # Collect every field first (counted in one pass, or threaded when there are many)
+        texts = []
+        num_names = 0
         for message in messages:
-            num_tokens += tokens_per_message
-            for key, value in message.items():
-                num_tokens += len(encoding.encode(value))
-                if key == "name":
-                    num_tokens += tokens_per_name
-
+            texts.extend(message.values())
+            if "name" in message:
+                num_names += 1
+
+        if len(texts) >= _ENCODE_BATCH_MIN_FIELDS:
+            encoded = encoding.encode_batch(texts, num_threads=_ENCODE_BATCH_THREADS)
+            num_tokens = sum(len(tokens) for tokens in encoded)
+        else:
+            num_tokens = sum(len(encoding.encode(text)) for text in texts)
+        num_tokens += tokens_per_message * len(messages) + tokens_per_name * num_names
         num_tokens += 3  # Every reply is primed with <|start|>assistant<|message|>
 
         return {
@@ -126,23 +174,18 @@ def count_prompt_and_completion(prompt: str, completion: str, model: str = "gpt-
             "estimated": bool
         }
     """
-    try:
-        input_tokens = count_with_tiktoken(prompt, model)
-        output_tokens = count_with_tiktoken(completion, model)
-
-        return {
-            "input_tokens": input_tokens,
-            "output_tokens": output_tokens,
-            "total_tokens": input_tokens + output_tokens,
-            "estimated": False
-        }
-    except ImportError:
+    if _HAS_TIKTOKEN:
+        # One encoding lookup for both texts
+        encoding = _get_encoding(model)
+        input_tokens = len(encoding.encode(prompt))
+        output_tokens = len(encoding.encode(completion))
+    else:
         input_tokens = estimate_tokens(prompt)
         output_tokens = estimate_tokens(completion)
 
-        return {
-            "input_tokens": input_tokens,
-            "output_tokens": output_tokens,
-            "total_tokens": input_tokens + output_tokens,
-            "estimated": True
-        }
+    return {
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "total_tokens": input_tokens + output_tokens,
+        "estimated": not _HAS_TIKTOKEN
+    }
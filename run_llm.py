@@ -3,6 +3,7 @@ Simple script to run different LLMs dynamically
 Usage: python run_llm.py --llm openai --prompt "your question"
 """
 
+import importlib
 import os
 import sys
 from pathlib import Path
@@ -27,27 +28,74 @@ def get_model_from_env(env_var: str, default_model: str) -> str:
         return model.strip()  # Clean whitespace
     return default_model
 
-# Import existing providers
-from llms.openai_llm import OpenAILLMProvider
-from llms.claude import ClaudeProvider
-from llms.gemini import GeminiProvider
-from llms.huggingface import HuggingFaceProvider
+def read_text_file(path: str, not_found_message: str) -> str | None:
+    """
+    Read a UTF-8 text file in one open/read (no separate exists() check).
+
+    Undecodable bytes are replaced instead of raising.
+
+    Args:
+        path: File path
+        not_found_message: Error printed if the file doesn't exist
+
+    Returns:
+        File contents, or None if the file doesn't exist
+    """
+    try:
+        return Path(path).read_text(encoding='utf-8', errors='replace')
+    except FileNotFoundError:
+        print(f"[ERROR] {not_found_message}: {path}")
+        return None
+
+# Existing providers: imported on first use, each pulls in a heavy SDK
+_PROVIDER_PATHS = {
+    'openai': ('llms.openai_llm', 'OpenAILLMProvider'),
+    'claude': ('llms.claude', 'ClaudeProvider'),
+    'gemini': ('llms.gemini', 'GeminiProvider'),
+    'huggingface': ('llms.huggingface', 'HuggingFaceProvider')
+}
 
 
 class SimpleLLMRunner:
     """Simple LLM executor"""
 
     def __init__(self):
-        self.providers = {
-            'openai': OpenAILLMProvider,
-            'claude': ClaudeProvider,
-            'gemini': GeminiProvider,
-            'huggingface': HuggingFaceProvider
+        self.providers = _PROVIDER_PATHS
+        # Provider instances reused across run() calls (keeps HTTP clients/connections alive)
+        self._instances = {}
+
+        # Provider-specific settings read from the environment, built on first use
+        self._config_builders = {
+            'openai': lambda: {
+                'api_key': os.getenv('OPENAI_API_KEY'),
+                'model_name': get_model_from_env('OPENAI_MODEL', 'gpt-4-turbo')
+            },
+            'claude': lambda: {
+                'api_key': os.getenv('ANTHROPIC_API_KEY'),
+                'model_name': get_model_from_env('CLAUDE_MODEL', 'claude-sonnet-4-20250514')
+            },
+            'gemini': lambda: {
+                'api_key': os.getenv('GOOGLE_API_KEY'),
+                'model_name': get_model_from_env('GEMINI_MODEL', 'gemini-1.5-pro')
+            },
+            'huggingface': lambda: {
+                'token': os.getenv('HF_TOKEN'),
+                'model_name': get_model_from_env('HUGGINGFACE_MODEL', 'deepseek-ai/DeepSeek-R1:novita')
+            }
         }
+        self._base_configs = {}
+
+    def _base_config(self, llm_name: str) -> dict:
+        """Environment-derived config for one provider (env is read once per process)."""
+        base = self._base_configs.get(llm_name)
+        if base is None:
+            base = self._base_configs[llm_name] = self._config_builders[llm_name]()
+        return base
 
     def run(self, llm_name: str, prompt: str, system_prompt: str = None,
             enable_logging: bool = True, enable_evaluation: bool = False,
-            context: str = None, ground_truth: str = None):
+            context: str = None, ground_truth: str = None,
+            semantic_cache: bool = False, eval_fast_mode: bool = False):
         """Execute a prompt on the specified LLM"""
 
         if llm_name not in self.providers:
@@ -55,47 +103,33 @@ class SimpleLLMRunner:
             print(f"Options: {', '.join(self.providers.keys())}")
             return None
 
-        # Basic configuration per LLM
-        configs = {
-            'openai': {
-                'api_key': os.getenv('OPENAI_API_KEY'),
-                'model_name': get_model_from_env('OPENAI_MODEL', 'gpt-4-turbo'),
-                'enable_logging': enable_logging,
-                'enable_evaluation': enable_evaluation,
-                'eval_context': context,
-                'eval_ground_truth': ground_truth
-            },
-            'claude': {
-                'api_key': os.getenv('ANTHROPIC_API_KEY'),
-                'model_name': get_model_from_env('CLAUDE_MODEL', 'claude-sonnet-4-20250514'),
-                'enable_logging': enable_logging,
-                'enable_evaluation': enable_evaluation,
-                'eval_context': context,
-                'eval_ground_truth': ground_truth
-            },
-            'gemini': {
-                'api_key': os.getenv('GOOGLE_API_KEY'),
-                'model_name': get_model_from_env('GEMINI_MODEL', 'gemini-1.5-pro'),
-                'enable_logging': enable_logging,
-                'enable_evaluation': enable_evaluation,
-                'eval_context': context,
-                'eval_ground_truth': ground_truth
-            },
-            'huggingface': {
-                'token': os.getenv('HF_TOKEN'),
-                'model_name': get_model_from_env('HUGGINGFACE_MODEL', 'deepseek-ai/DeepSeek-R1:novita'),
-                'enable_logging': enable_logging,
-                'enable_evaluation': enable_evaluation,
-                'eval_context': context,
-                'eval_ground_truth': ground_truth
-            }
+        # Basic configuration per LLM (only the selected provider's entry is built)
+        config = {
+            **self._base_config(llm_name),
+            'enable_logging': enable_logging,
+            'enable_evaluation': enable_evaluation,
+            'eval_context': context,
+            'eval_ground_truth': ground_truth,
+            'eval_fast_mode': eval_fast_mode
         }
+        if llm_name == 'claude':
+            config['semantic_cache'] = semantic_cache
 
         try:
-            # Create provider instance
-            provider_class = self.providers[llm_name]
-            config = configs[llm_name]
-            provider = provider_class(config)
+            # Reuse the provider for the same model and construction-time options;
+            # per-run evaluation settings are refreshed on the cached instance
+            key = (llm_name, config['model_name'], enable_logging, semantic_cache)
+            provider = self._instances.get(key)
+            if provider is None:
+                mod_name, cls_name = self.providers[llm_name]
+                provider_class = getattr(importlib.import_module(mod_name), cls_name)
+                provider = provider_class(config)
+                self._instances[key] = provider
+            else:
+                provider.enable_evaluation = enable_evaluation
+                provider.eval_context = context
+                provider.eval_ground_truth = ground_truth
+                provider.eval_fast_mode = eval_fast_mode
 
             print(f"\n[OK] Using: {llm_name} ({config.get('model_name', 'default model')})")
             print(f"[*] Executing prompt...\n")
@@ -109,6 +143,11 @@ class SimpleLLMRunner:
             print(f"[ERROR] Error executing {llm_name}: {e}")
             return None
 
+    def flush(self):
+        """Wait for background logging/evaluation of every provider used so far."""
+        for provider in self._instances.values():
+            provider.flush()
+
     def list_available(self):
         """List available LLMs"""
         print("\n[INFO] Available LLMs:")
@@ -132,6 +171,8 @@ def main():
                        help='List available LLMs')
     parser.add_argument('--eval', action='store_true',
                        help='Enable RAGAS evaluation (coherence, relevance)')
+    parser.add_argument('--eval-fast', action='store_true',
+                       help='Fast triage evaluation: prompt/response embedding similarity only (implies --eval)')
     parser.add_argument('--context', type=str,
                        help='Context for evaluation (enables faithfulness metric)')
     parser.add_argument('--context-file', type=str,
@@ -142,6 +183,8 @@ def main():
                        help='File containing ground truth answer for evaluation')
     parser.add_argument('--no-log', action='store_true',
                        help='Disable automatic JSON logging')
+    parser.add_argument('--semantic-cache', action='store_true',
+                       help='Reuse responses for semantically equivalent prompts (claude only)')
 
     args = parser.parse_args()
 
@@ -154,11 +197,8 @@ def main():
     # Get prompt
     prompt = args.prompt
     if args.prompt_file:
-        prompt_path = Path(args.prompt_file)
-        if prompt_path.exists():
-            prompt = prompt_path.read_text(encoding='utf-8')
-        else:
-            print(f"[ERROR] File not found: {args.prompt_file}")
+        prompt = read_text_file(args.prompt_file, "File not found")
+        if prompt is None:
             return
 
     if not prompt:
@@ -169,26 +209,20 @@ def main():
     # Get context (for evaluation)
     context = args.context
     if args.context_file:
-        context_path = Path(args.context_file)
-        if context_path.exists():
-            context = context_path.read_text(encoding='utf-8')
-        else:
-            print(f"[ERROR] Context file not found: {args.context_file}")
+        context = read_text_file(args.context_file, "Context file not found")
+        if context is None:
             return
 
     # Get ground truth (for evaluation)
     ground_truth = args.ground_truth
     if args.ground_truth_file:
-        gt_path = Path(args.ground_truth_file)
-        if gt_path.exists():
-            ground_truth = gt_path.read_text(encoding='utf-8')
-        else:
-            print(f"[ERROR] Ground truth file not found: {args.ground_truth_file}")
+        ground_truth = read_text_file(args.ground_truth_file, "Ground truth file not found")
+        if ground_truth is None:
             return
 
     # Execute with logging configuration
     enable_logging = not args.no_log  # Logging on by default, unless --no-log
-    enable_evaluation = args.eval  # Evaluation off by default, unless --eval
+    enable_evaluation = args.eval or args.eval_fast  # Evaluation off by default, unless --eval
 
     response = runner.run(
         args.llm,
@@ -197,7 +231,9 @@ def main():
         enable_logging=enable_logging,
         enable_evaluation=enable_evaluation,
         context=context,
-        ground_truth=ground_truth
+        ground_truth=ground_truth,
+        semantic_cache=args.semantic_cache,
+        eval_fast_mode=args.eval_fast
     )
 
     if response:
@@ -207,6 +243,9 @@ def main():
         print(response)
         print("="*60 + "\n")
 
+    # Finish logging/evaluation now instead of at interpreter exit
+    runner.flush()
+
 
 if __name__ == "__main__":
     main()
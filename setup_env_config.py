@@ -4,11 +4,15 @@ Script para configurar PYTHON_ENV.md en nuevos proyectos.
 
 Uso:
     python setup_env_config.py --project "MiProyecto" --path "D:/mi_proyecto"
+    python setup_env_config.py --batch proyectos.json
 """
 
-import argparse
+import io
+import os
+import string
+import sys
+import time
 from pathlib import Path
-from datetime import datetime
 
 
 TEMPLATE = """# Python Environment Configuration
@@ -183,8 +187,117 @@ cd {project_path_unix}
 - [Python Virtual Environments](https://docs.python.org/3/tutorial/venv.html)
 """
 
+# Plantilla pre-parseada una sola vez y pre-codificada a UTF-8:
+# _SEGMENTS[i] es texto literal (bytes), _SLOTS[i] la variable que le sigue (o None)
+_PARSED = [(literal, field) for literal, field, _, _ in string.Formatter().parse(TEMPLATE)]
+_SEGMENTS = [literal.encode("utf-8") for literal, _ in _PARSED]
+_SLOTS = [field for _, field in _PARSED]
 
-def create_env_config(project_name: str, project_path: str, output_file: str = None):
+
+def _render(project_name: str, project_path: str, project_path_unix: str, update_date: str) -> bytes:
+    """
+    Rellena la plantilla directamente en bytes UTF-8.
+
+    Los literales (~3 KB) se codificaron al importar; por llamada solo se
+    codifican los cuatro valores.
+    """
+    values = {
+        "project_name": project_name.encode("utf-8"),
+        "project_path": project_path.encode("utf-8"),
+        "project_path_unix": project_path_unix.encode("utf-8"),
+        "update_date": update_date.encode("utf-8"),
+    }
+    out = bytearray()
+    for segment, slot in zip(_SEGMENTS, _SLOTS):
+        out += segment
+        if slot is not None:
+            out += values[slot]
+    return bytes(out)
+
+
+# Barras invertidas -> barras (str.translate, una sola pasada en C)
+_BACKSLASH_TABLE = str.maketrans({"\\": "/"})
+
+# Fecha de hoy memoizada: (fecha "YYYY-MM-DD", timestamp de la próxima medianoche local)
+_TODAY = (None, 0.0)
+
+
+def _today_iso() -> str:
+    """Fecha local de hoy (YYYY-MM-DD), formateada una sola vez por día."""
+    global _TODAY
+    today, expires = _TODAY
+    if today is None or time.time() >= expires:
+        from datetime import datetime, timedelta
+
+        now = datetime.now()
+        midnight = datetime(now.year, now.month, now.day) + timedelta(days=1)
+        today = f"{now.year:04d}-{now.month:02d}-{now.day:02d}"
+        _TODAY = (today, midnight.timestamp())
+    return today
+
+
+def _to_unix_path(project_path: str) -> str:
+    """Convierte una ruta Windows a formato Unix (para bash): D:\\x -> /d/x."""
+    project_path_unix = project_path.translate(_BACKSLASH_TABLE)
+    if project_path_unix.startswith("D:"):
+        return "/d" + project_path_unix[2:]
+    return project_path_unix
+
+
+def _output_path(project_path: str, output_file: str | None) -> Path:
+    """Ruta de salida: output_file o {project_path}/PYTHON_ENV.md por defecto."""
+    if output_file is None:
+        return Path(project_path) / "PYTHON_ENV.md"
+    return Path(output_file)
+
+
+def _write_if_changed(output_path: Path, data: bytes) -> bool:
+    """
+    Escribe data en output_path salvo que el archivo ya tenga exactamente ese contenido.
+
+    La escritura es atómica: archivo temporal + os.replace, así ningún lector ve
+    un archivo a medio escribir.
+
+    Returns:
+        True si se escribió, False si ya estaba actualizado
+    """
+    # Comparar tamaño primero (stat) y solo leer si coincide
+    try:
+        if output_path.stat().st_size == len(data) and output_path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+
+    import tempfile
+
+    # Temporal único en el mismo directorio (os.replace no cruza sistemas de archivos)
+    fd, tmp_name = tempfile.mkstemp(dir=output_path.parent, prefix=f".{output_path.name}.", suffix=".tmp")
+    try:
+        try:
+            # os.write puede escribir menos bytes de los pedidos: repetir hasta el final
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.chmod(tmp_name, 0o644)  # mkstemp crea con 0o600
+        os.replace(tmp_name, output_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    return True
+
+
+def create_env_config(
+    project_name: str,
+    project_path: str,
+    output_file: str = None,
+    update_date: str = None,
+    project_path_unix: str = None
+):
     """
     Crea el archivo PYTHON_ENV.md para un proyecto.
 
@@ -192,67 +305,168 @@ def create_env_config(project_name: str, project_path: str, output_file: str = N
         project_name: Nombre del proyecto
         project_path: Ruta del proyecto (ej: D:/mi_proyecto)
         output_file: Ruta donde guardar el archivo (default: {project_path}/PYTHON_ENV.md)
+        update_date: Fecha YYYY-MM-DD precalculada (default: hoy)
+        project_path_unix: Ruta en formato Unix precalculada (default: derivada de project_path)
     """
     # Convertir path a formato Unix (para bash)
-    project_path_unix = project_path.replace("\\", "/")
-    if project_path_unix.startswith("D:"):
-        project_path_unix = "/d" + project_path_unix[2:]
+    if project_path_unix is None:
+        project_path_unix = _to_unix_path(project_path)
 
     # Fecha actual
-    update_date = datetime.now().strftime("%Y-%m-%d")
+    if update_date is None:
+        update_date = _today_iso()
 
     # Rellenar plantilla
-    content = TEMPLATE.format(
-        project_name=project_name,
-        project_path=project_path,
-        project_path_unix=project_path_unix,
-        update_date=update_date
-    )
+    content = _render(project_name, project_path, project_path_unix, update_date)
 
     # Determinar ruta de salida
-    if output_file is None:
-        output_path = Path(project_path) / "PYTHON_ENV.md"
-    else:
-        output_path = Path(output_file)
+    output_path = _output_path(project_path, output_file)
 
     # Crear directorio si no existe
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Escribir archivo
-    output_path.write_text(content, encoding="utf-8")
+    # Escribir archivo (si el contenido cambió)
+    status = "creado" if _write_if_changed(output_path, content) else "sin cambios"
+
+    # Un solo write en lugar de varios print
+    sys.stdout.write(
+        f"✅ Archivo {status}: {output_path}\n"
+        f"📦 Proyecto: {project_name}\n"
+        f"📁 Ruta: {project_path}\n"
+        f"\n💡 Siguiente paso:\n"
+        f"   Copia este archivo a tu repositorio y actualiza .gitignore\n"
+    )
+
+
+def create_env_configs(projects: list[tuple[str, str, str | None]]) -> list[Path]:
+    """
+    Crea PYTHON_ENV.md para varios proyectos de una vez.
 
-    print(f"✅ Archivo creado: {output_path}")
-    print(f"📦 Proyecto: {project_name}")
-    print(f"📁 Ruta: {project_path}")
-    print(f"\n💡 Siguiente paso:")
-    print(f"   Copia este archivo a tu repositorio y actualiza .gitignore")
+    Renderiza todo primero, crea cada directorio padre una sola vez y escribe
+    los archivos con os.open/os.write en un bucle, con un único resumen final.
+
+    Args:
+        projects: Lista de tuplas (nombre_proyecto, ruta_proyecto, archivo_salida | None)
+
+    Returns:
+        Rutas de salida de todos los proyectos (escritos o ya actualizados)
+    """
+    update_date = _today_iso()
+
+    outputs = [
+        (
+            _output_path(project_path, output_file),
+            _render(project_name, project_path, _to_unix_path(project_path), update_date),
+        )
+        for project_name, project_path, output_file in projects
+    ]
+
+    # Un mkdir por directorio distinto
+    for parent in {output_path.parent for output_path, _ in outputs}:
+        parent.mkdir(parents=True, exist_ok=True)
+
+    created = []
+    unchanged = 0
+    for output_path, content in outputs:
+        if _write_if_changed(output_path, content):
+            created.append(output_path)
+        else:
+            unchanged += 1
+
+    # Resumen acumulado en memoria y escrito de una vez
+    summary = io.StringIO()
+    summary.write(f"✅ {len(created)} archivos creados, {unchanged} sin cambios\n")
+    for path in created:
+        summary.write(f"   - {path}\n")
+    sys.stdout.write(summary.getvalue())
+    return [output_path for output_path, _ in outputs]
+
+
+def _load_batch(batch_file: str) -> list[tuple[str, str, str | None]]:
+    """
+    Lee un JSON de proyectos para --batch.
+
+    Formato: lista de objetos {"project": ..., "path": ..., "output": ... (opcional)}
+    o de listas [project, path] / [project, path, output].
+    """
+    import json
+
+    with open(batch_file, encoding="utf-8") as f:
+        entries = json.load(f)
+
+    projects = []
+    for entry in entries:
+        if isinstance(entry, dict):
+            projects.append((entry["project"], entry["path"], entry.get("output")))
+        else:
+            project_name, project_path, *rest = entry
+            projects.append((project_name, project_path, rest[0] if rest else None))
+    return projects
+
+
+USAGE = """uso: setup_env_config.py [-h] [--project PROJECT] [--path PATH] [--output OUTPUT] [--batch BATCH]
+
+Configurar PYTHON_ENV.md para nuevos proyectos
+
+opciones:
+  -h, --help            muestra esta ayuda y sale
+  --project, -p PROJECT Nombre del proyecto (ej: 'MiProyecto')
+  --path, -d PATH       Ruta del proyecto (ej: 'D:/mi_proyecto')
+  --output, -o OUTPUT   Ruta de salida personalizada (opcional)
+  --batch, -b BATCH     JSON con varios proyectos: [{"project": ..., "path": ..., "output": ...}, ...]
+"""
+
+# Opción (larga y corta) -> clave en args
+_OPTIONS = {
+    "--project": "project", "-p": "project",
+    "--path": "path", "-d": "path",
+    "--output": "output", "-o": "output",
+    "--batch": "batch", "-b": "batch",
+}
+
+
+def _usage_error(message: str):
+    """Imprime el uso y el error en stderr y sale con código 2 (como argparse)."""
+    sys.stderr.write(f"{USAGE.splitlines()[0]}\nsetup_env_config.py: error: {message}\n")
+    sys.exit(2)
+
+
+def _parse_args(argv: list[str]) -> dict[str, str | None]:
+    """
+    Recorre argv a mano (sin argparse, que domina el arranque del script).
+
+    Acepta "--opcion valor" y "--opcion=valor"; -h/--help imprime USAGE y sale.
+    """
+    args = dict.fromkeys(("project", "path", "output", "batch"))
+    it = iter(argv)
+    for arg in it:
+        if arg in ("-h", "--help"):
+            sys.stdout.write(USAGE)
+            sys.exit(0)
+
+        option, sep, value = arg.partition("=")
+        key = _OPTIONS.get(option)
+        if key is None:
+            _usage_error(f"argumento no reconocido: {arg}")
+        if not sep:
+            value = next(it, None)
+            if value is None:
+                _usage_error(f"el argumento {option} requiere un valor")
+        args[key] = value
+    return args
 
 
 def main():
-    parser = argparse.ArgumentParser(
-        description="Configurar PYTHON_ENV.md para nuevos proyectos"
-    )
-    parser.add_argument(
-        "--project",
-        "-p",
-        required=True,
-        help="Nombre del proyecto (ej: 'MiProyecto')"
-    )
-    parser.add_argument(
-        "--path",
-        "-d",
-        required=True,
-        help="Ruta del proyecto (ej: 'D:/mi_proyecto')"
-    )
-    parser.add_argument(
-        "--output",
-        "-o",
-        help="Ruta de salida personalizada (opcional)"
-    )
+    args = _parse_args(sys.argv[1:])
+
+    if args["batch"]:
+        create_env_configs(_load_batch(args["batch"]))
+        return
 
-    args = parser.parse_args()
+    if not args["project"] or not args["path"]:
+        _usage_error("--project y --path son obligatorios (o usa --batch)")
 
-    create_env_config(args.project, args.path, args.output)
+    create_env_config(args["project"], args["path"], args["output"])
 
 
 if __name__ == "__main__":
@@ -0,0 +1,60 @@
+"""
+AsyncExecutionLogger must write every queued log before the interpreter exits.
+
+Run with: python -m unittest discover tests
+"""
+
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Stub provider: logging runs through the real background worker and async logger
+SCRIPT = textwrap.dedent("""
+    import os
+    import sys
+
+    sys.path.insert(0, sys.argv[1])
+    os.chdir(sys.argv[2])
+
+    from llms.base import LLMProvider
+
+    class StubProvider(LLMProvider):
+        def generate(self, prompt, system_prompt=None, temperature=None, max_tokens=None):
+            return "ok"
+
+        def get_metadata(self):
+            return {"provider": "stub", "model": self.model_name}
+
+        def get_usage_info(self):
+            return {"input_tokens": 1, "output_tokens": 1, "total_tokens": 2}
+
+    provider = StubProvider({"model_name": "stub-model", "async_logging": True})
+    for i in range(int(sys.argv[3])):
+        provider.generate_with_logging(f"prompt {i}")
+""")
+
+
+class AsyncLoggerExitTest(unittest.TestCase):
+    def _run(self, n_records: int) -> list[Path]:
+        with tempfile.TemporaryDirectory() as workdir:
+            subprocess.run(
+                [sys.executable, "-c", SCRIPT, str(REPO_ROOT), workdir, str(n_records)],
+                check=True,
+                timeout=60,
+            )
+            return [p for p in (Path(workdir) / "logs").glob("*.json") if p.name != "_index.json"]
+
+    def test_single_record_written_at_exit(self):
+        self.assertEqual(len(self._run(1)), 1)
+
+    def test_all_records_written_at_exit(self):
+        self.assertEqual(len(self._run(40)), 40)
+
+
+if __name__ == "__main__":
+    unittest.main()